@@ -0,0 +1,23 @@
+"""
+Builds the optional compiled '_accelerator' module in place, next to the pure Python sources.
+Requires a C compiler and the Python headers, no network access is needed.
+
+Runs automatically as build script when the package is installed from source (i.e. 'pip install' of the sdist).
+If the module cannot be compiled, the package falls back to the pure Python implementation.
+
+Usage: python build_accelerator.py
+"""
+import sys
+
+from setuptools import Extension, setup
+
+if __name__ == "__main__":
+    try:
+        setup(
+            name="pypruningradixtrie-accelerator",
+            ext_modules=[Extension("pypruningradixtrie._accelerator", ["pypruningradixtrie/_accelerator.c"])],
+            script_args=["build_ext", "--inplace"],
+        )
+    except (Exception, SystemExit) as e:
+        print(f"WARNING: could not build the optional accelerator module, using pure Python instead: {e}",
+              file=sys.stderr)
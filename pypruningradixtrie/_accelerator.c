@@ -0,0 +1,445 @@
+/*
+ * Optional compiled versions of the hot path functions in 'pypruningradixtrie.accelerator'.
+ *
+ * Operates directly on the Python objects of the trie (TrieNode, children lists),
+ * so a trie built by the pure Python code can be queried without any conversion.
+ * Build it with 'python build_accelerator.py'.
+ */
+#define PY_SSIZE_T_CLEAN
+#include <Python.h>
+
+static PyObject *str_node_score = NULL;
+static PyObject *str_is_word_end = NULL;
+static PyObject *str_children = NULL;
+static PyObject *str_max_score_children = NULL;
+static PyObject *str_empty = NULL;
+
+
+static Py_ssize_t
+shared_prefix_len(PyObject *term1, PyObject *term2)
+{
+    Py_ssize_t len = Py_MIN(PyUnicode_GET_LENGTH(term1), PyUnicode_GET_LENGTH(term2));
+    int kind1 = PyUnicode_KIND(term1);
+    int kind2 = PyUnicode_KIND(term2);
+    const void *data1 = PyUnicode_DATA(term1);
+    const void *data2 = PyUnicode_DATA(term2);
+    Py_ssize_t i;
+
+    for (i = 0; i < len; i++) {
+        if (PyUnicode_READ(kind1, data1, i) != PyUnicode_READ(kind2, data2, i)) {
+            break;
+        }
+    }
+
+    return i;
+}
+
+
+static PyObject *
+calc_shared_prefix_len(PyObject *self, PyObject *args)
+{
+    PyObject *term1, *term2;
+
+    if (!PyArg_ParseTuple(args, "UU:calc_shared_prefix_len", &term1, &term2)) {
+        return NULL;
+    }
+
+    return PyLong_FromSsize_t(shared_prefix_len(term1, term2));
+}
+
+
+static PyObject *
+find_child_index(PyObject *self, PyObject *args)
+{
+    PyObject *children, *term;
+
+    if (!PyArg_ParseTuple(args, "O!U:find_child_index", &PyList_Type, &children, &term)) {
+        return NULL;
+    }
+
+    if (PyUnicode_GET_LENGTH(term) == 0) {
+        return PyLong_FromLong(-1);
+    }
+
+    Py_UCS4 first_char = PyUnicode_READ_CHAR(term, 0);
+
+    for (Py_ssize_t i = 0; i < PyList_GET_SIZE(children); i++) {
+        PyObject *child = PyList_GET_ITEM(children, i);
+        if (!PyTuple_Check(child) || PyTuple_GET_SIZE(child) != 2 || !PyUnicode_Check(PyTuple_GET_ITEM(child, 0))) {
+            PyErr_SetString(PyExc_TypeError, "children must be a list of (str, TrieNode) tuples");
+            return NULL;
+        }
+
+        PyObject *key = PyTuple_GET_ITEM(child, 0);
+        if (PyUnicode_GET_LENGTH(key) > 0 && PyUnicode_READ_CHAR(key, 0) == first_char) {
+            return PyLong_FromSsize_t(i);
+        }
+    }
+
+    return PyLong_FromLong(-1);
+}
+
+
+/*
+ * Compare the given score against the score of the last result, using the given operator.
+ * Returns 1 / 0 for the outcome of the comparison and -1 on error.
+ */
+static int
+compare_with_last_result(PyObject *score, PyObject *results, Py_ssize_t top_k, int op)
+{
+    PyObject *last_result = PyList_GET_ITEM(results, top_k - 1);
+    if (!PyTuple_Check(last_result) || PyTuple_GET_SIZE(last_result) != 2) {
+        PyErr_SetString(PyExc_TypeError, "results must be a list of (term, score) tuples");
+        return -1;
+    }
+
+    return PyObject_RichCompareBool(score, PyTuple_GET_ITEM(last_result, 1), op);
+}
+
+
+/* Same as 'PruningRadixTrie._should_skip_all_children_of_node'. */
+static int
+should_skip_all_children_of_node(PyObject *node, PyObject *results, Py_ssize_t top_k)
+{
+    if (PyList_GET_SIZE(results) != top_k) {
+        return 0;
+    }
+
+    PyObject *max_score_children = PyObject_GetAttr(node, str_max_score_children);
+    if (max_score_children == NULL) {
+        return -1;
+    }
+
+    int skip = compare_with_last_result(max_score_children, results, top_k, Py_LE);
+    Py_DECREF(max_score_children);
+
+    return skip;
+}
+
+
+/* Same as 'PruningRadixTrie._should_skip_node_and_all_children'. */
+static int
+should_skip_node_and_all_children(PyObject *node, PyObject *results, Py_ssize_t top_k)
+{
+    int skip = should_skip_all_children_of_node(node, results, top_k);
+    if (skip <= 0) {
+        return skip;
+    }
+
+    PyObject *score = PyObject_GetAttr(node, str_node_score);
+    if (score == NULL) {
+        return -1;
+    }
+
+    skip = compare_with_last_result(score, results, top_k, Py_LE);
+    Py_DECREF(score);
+
+    return skip;
+}
+
+
+/*
+ * Same as 'trie._add_to_results': the results stay sorted by score descending,
+ * results with equal scores keep the order in which they were found.
+ * Candidates that would be removed again right away are not created at all.
+ */
+static int
+add_to_results(PyObject *child_node, PyObject *child_term, PyObject *prefix_string,
+               Py_ssize_t top_k, PyObject *results)
+{
+    PyObject *score = PyObject_GetAttr(child_node, str_node_score);
+    if (score == NULL) {
+        return -1;
+    }
+
+    Py_ssize_t num_results = PyList_GET_SIZE(results);
+    Py_ssize_t index = num_results;
+
+    while (index > 0) {
+        int is_lower = compare_with_last_result(score, results, index, Py_GT);
+        if (is_lower < 0) {
+            Py_DECREF(score);
+            return -1;
+        }
+        if (!is_lower) {
+            break;
+        }
+        index--;
+    }
+
+    if (index >= top_k) {
+        Py_DECREF(score);
+        return 0;
+    }
+
+    PyObject *term = PyUnicode_Concat(prefix_string, child_term);
+    if (term == NULL) {
+        Py_DECREF(score);
+        return -1;
+    }
+
+    PyObject *new_result = PyTuple_Pack(2, term, score);
+    Py_DECREF(term);
+    Py_DECREF(score);
+    if (new_result == NULL) {
+        return -1;
+    }
+
+    int error = PyList_Insert(results, index, new_result);
+    Py_DECREF(new_result);
+    if (error) {
+        return -1;
+    }
+
+    if (PyList_GET_SIZE(results) > top_k) {
+        return PyList_SetSlice(results, top_k, PyList_GET_SIZE(results), NULL);
+    }
+
+    return 0;
+}
+
+
+static int
+node_has_children(PyObject *node, PyObject **children)
+{
+    *children = PyObject_GetAttr(node, str_children);
+    if (*children == NULL) {
+        return -1;
+    }
+    if (!PyList_Check(*children)) {
+        Py_CLEAR(*children);
+        PyErr_SetString(PyExc_TypeError, "TrieNode.children must be a list");
+        return -1;
+    }
+
+    return PyList_GET_SIZE(*children) > 0;
+}
+
+
+static int
+find_all_child_terms(PyObject *prefix_to_restrict_children, PyObject *base_node, Py_ssize_t top_k,
+                     PyObject *current_branch_term, PyObject *results);
+
+
+static int
+collect_child_terms(PyObject *prefix_to_restrict_children, PyObject *base_node, Py_ssize_t top_k,
+                    PyObject *current_branch_term, PyObject *results)
+{
+    int skip = should_skip_all_children_of_node(base_node, results, top_k);
+    if (skip != 0) {
+        return skip < 0 ? -1 : 0;
+    }
+
+    PyObject *children = PyObject_GetAttr(base_node, str_children);
+    if (children == NULL) {
+        return -1;
+    }
+    if (!PyList_Check(children)) {
+        Py_DECREF(children);
+        PyErr_SetString(PyExc_TypeError, "TrieNode.children must be a list");
+        return -1;
+    }
+
+    int should_not_restrict_children = PyUnicode_GET_LENGTH(prefix_to_restrict_children) == 0;
+    int result = 0;
+
+    for (Py_ssize_t i = 0; i < PyList_GET_SIZE(children); i++) {
+        PyObject *child = PyList_GET_ITEM(children, i);
+        if (!PyTuple_Check(child) || PyTuple_GET_SIZE(child) != 2 || !PyUnicode_Check(PyTuple_GET_ITEM(child, 0))) {
+            PyErr_SetString(PyExc_TypeError, "children must be a list of (str, TrieNode) tuples");
+            result = -1;
+            break;
+        }
+
+        PyObject *child_term = PyTuple_GET_ITEM(child, 0);
+        PyObject *child_node = PyTuple_GET_ITEM(child, 1);
+        PyObject *grand_children = NULL;
+        PyObject *branch_term = NULL;
+
+        skip = should_skip_node_and_all_children(child_node, results, top_k);
+        if (skip < 0) {
+            result = -1;
+            break;
+        }
+
+        if (skip) {
+            if (should_not_restrict_children) {
+                continue;
+            }
+            break;
+        }
+
+        int is_prefix_of_child = should_not_restrict_children ||
+            PyUnicode_Tailmatch(child_term, prefix_to_restrict_children, 0, PY_SSIZE_T_MAX, -1);
+        if (is_prefix_of_child < 0) {
+            result = -1;
+            break;
+        }
+
+        if (is_prefix_of_child) {
+
+            PyObject *is_word_end_obj = PyObject_GetAttr(child_node, str_is_word_end);
+            if (is_word_end_obj == NULL) {
+                result = -1;
+                break;
+            }
+            int is_word_end = PyObject_IsTrue(is_word_end_obj);
+            Py_DECREF(is_word_end_obj);
+
+            if (is_word_end < 0 ||
+                    (is_word_end && add_to_results(child_node, child_term, current_branch_term, top_k, results) < 0)) {
+                result = -1;
+                break;
+            }
+
+            int has_children = node_has_children(child_node, &grand_children);
+            if (has_children < 0) {
+                result = -1;
+                break;
+            }
+
+            if (has_children) {
+                branch_term = PyUnicode_Concat(current_branch_term, child_term);
+                if (branch_term == NULL ||
+                        find_all_child_terms(str_empty, child_node, top_k, branch_term, results) < 0) {
+                    result = -1;
+                }
+            }
+
+            Py_XDECREF(grand_children);
+            Py_XDECREF(branch_term);
+
+            if (result < 0 || !should_not_restrict_children) {
+                break;
+            }
+        }
+        else {
+            int is_prefix_of_restriction = PyUnicode_Tailmatch(prefix_to_restrict_children, child_term,
+                                                               0, PY_SSIZE_T_MAX, -1);
+            if (is_prefix_of_restriction < 0) {
+                result = -1;
+                break;
+            }
+            if (!is_prefix_of_restriction) {
+                continue;
+            }
+
+            int has_children = node_has_children(child_node, &grand_children);
+            if (has_children < 0) {
+                result = -1;
+                break;
+            }
+
+            if (has_children) {
+                PyObject *new_prefix_to_restrict_by = PyUnicode_Substring(
+                    prefix_to_restrict_children, PyUnicode_GET_LENGTH(child_term),
+                    PyUnicode_GET_LENGTH(prefix_to_restrict_children));
+                branch_term = PyUnicode_Concat(current_branch_term, child_term);
+
+                if (new_prefix_to_restrict_by == NULL || branch_term == NULL ||
+                        find_all_child_terms(new_prefix_to_restrict_by, child_node, top_k, branch_term, results) < 0) {
+                    result = -1;
+                }
+
+                Py_XDECREF(new_prefix_to_restrict_by);
+            }
+
+            Py_XDECREF(grand_children);
+            Py_XDECREF(branch_term);
+
+            break;
+        }
+    }
+
+    Py_DECREF(children);
+
+    return result;
+}
+
+
+/* Same as 'PruningRadixTrie.__find_all_child_terms'.
+ * Recurses once per trie level, so deep tries raise a RecursionError instead of overflowing the C stack. */
+static int
+find_all_child_terms(PyObject *prefix_to_restrict_children, PyObject *base_node, Py_ssize_t top_k,
+                     PyObject *current_branch_term, PyObject *results)
+{
+    if (Py_EnterRecursiveCall(" in find_top_k")) {
+        return -1;
+    }
+
+    int result = collect_child_terms(prefix_to_restrict_children, base_node, top_k, current_branch_term, results);
+
+    Py_LeaveRecursiveCall();
+
+    return result;
+}
+
+
+static PyObject *
+find_top_k(PyObject *self, PyObject *args)
+{
+    PyObject *root, *prefix;
+    Py_ssize_t top_k;
+
+    if (!PyArg_ParseTuple(args, "OOn:find_top_k", &root, &prefix, &top_k)) {
+        return NULL;
+    }
+
+    if (prefix == Py_None) {
+        prefix = str_empty;
+    }
+    else if (!PyUnicode_Check(prefix)) {
+        PyErr_SetString(PyExc_TypeError, "prefix must be a str");
+        return NULL;
+    }
+
+    PyObject *results = PyList_New(0);
+    if (results == NULL) {
+        return NULL;
+    }
+
+    if (top_k > 0 && find_all_child_terms(prefix, root, top_k, str_empty, results) < 0) {
+        Py_DECREF(results);
+        return NULL;
+    }
+
+    return results;
+}
+
+
+static PyMethodDef accelerator_methods[] = {
+    {"calc_shared_prefix_len", calc_shared_prefix_len, METH_VARARGS,
+     "Determines the number of shared characters from the start between the given terms."},
+    {"find_child_index", find_child_index, METH_VARARGS,
+     "Find the index of the child which shares a prefix with the given term, -1 if there is none."},
+    {"find_top_k", find_top_k, METH_VARARGS,
+     "Collect the top_k (term, score) tuples for the prefix, starting from the given root node."},
+    {NULL, NULL, 0, NULL}
+};
+
+
+static struct PyModuleDef accelerator_module = {
+    PyModuleDef_HEAD_INIT,
+    "_accelerator",
+    "Compiled hot path functions of the trie.",
+    -1,
+    accelerator_methods
+};
+
+
+PyMODINIT_FUNC
+PyInit__accelerator(void)
+{
+    str_node_score = PyUnicode_InternFromString("_TrieNode__score");
+    str_is_word_end = PyUnicode_InternFromString("is_word_end");
+    str_children = PyUnicode_InternFromString("children");
+    str_max_score_children = PyUnicode_InternFromString("max_score_children");
+    str_empty = PyUnicode_InternFromString("");
+
+    if (str_node_score == NULL || str_is_word_end == NULL ||
+            str_children == NULL || str_max_score_children == NULL || str_empty == NULL) {
+        return NULL;
+    }
+
+    return PyModule_Create(&accelerator_module);
+}
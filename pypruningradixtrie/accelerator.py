@@ -0,0 +1,59 @@
+"""
+Hot path functions of the trie.
+
+The pure Python implementations below are replaced by the ones of the optional compiled
+'_accelerator' module if it was built (see 'build_accelerator.py').
+Both implementations produce identical results.
+"""
+from typing import List, Tuple
+
+
+def calc_shared_prefix_len(term1: str, term2: str) -> int:
+    """
+    Determines the number of shared characters from the start between the given terms.
+
+    :return: An Integer in the range from 0 to n (= length of shorter term)
+    """
+    len_shared: int = 0
+
+    for i in range(0, min(len(term1), len(term2))):
+        if term1[i] == term2[i]:
+            len_shared = i + 1
+        else:
+            break
+
+    return len_shared
+
+
+def find_child_index(children: List[Tuple[str, object]], term: str) -> int:
+    """
+    Find the child which shares a prefix with the given term.
+    There can be at most one, because no two children of a node start with the same character.
+
+    :param children: the children of a node
+    :param term: the term to look for
+
+    :return: the index of the child in children or -1 if no child shares a prefix with the term
+    """
+    if not term:
+        return -1
+
+    first_char: str = term[0]
+
+    for i, (key, _) in enumerate(children):
+        if key[:1] == first_char:
+            return i
+
+    return -1
+
+
+# Collects the top_k (term, score) tuples for the prefix, starting from the given root node.
+# Only available in the compiled module, the pure Python version is part of 'PruningRadixTrie'.
+find_top_k = None
+
+try:
+    from pypruningradixtrie._accelerator import calc_shared_prefix_len, find_child_index, find_top_k  # noqa: F811
+
+    ACCELERATED: bool = True
+except ImportError:
+    ACCELERATED: bool = False
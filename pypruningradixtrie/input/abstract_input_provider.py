@@ -1,5 +1,5 @@
 import abc
-from typing import List
+from typing import Iterator, List
 
 from pypruningradixtrie.input.input import Input
 
@@ -12,6 +12,13 @@ class AbstractInputProvider:
     @abc.abstractmethod
     def read_input_data(file_path: str) -> List[Input]:
         raise NotImplementedError
+
+    """
+    Lazily reads the input data entry by entry, in the order of the file.
+    Override this in providers that can stream their file, the default reads the whole file at once.
+    """
+    def iter_input_data(self, file_path: str) -> Iterator[Input]:
+        return iter(self.read_input_data(file_path))
     
     """
     Opens the input data stream. This is helpful when you want to use another library to read the file stream (e.g. smart_open, ...).
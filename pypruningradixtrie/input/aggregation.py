@@ -0,0 +1,112 @@
+import logging
+import pickle
+import tempfile
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+from pypruningradixtrie.input.input import Input
+
+# number of files the entries are spread over when the distinct terms do not fit into memory
+NUM_SPILL_PARTITIONS: int = 16
+# maximum depth of re-partitioning a partition that still has too many distinct terms
+MAX_SPILL_LEVELS: int = 8
+
+
+def aggregate_input(entries: Iterable[Input], max_terms_in_memory: int = None,
+                    spill_dir: str = None) -> Iterator[Input]:
+    """
+    Sum up the scores of identical terms, so that every distinct term has to be inserted into the trie only once.
+
+    If there are more than max_terms_in_memory distinct terms, the partially aggregated entries are spilled
+    into temporary files, partitioned by the hash of their term. Each partition is aggregated on its own afterwards,
+    if needed recursively with the same memory bound.
+
+    :param entries: the entries to aggregate
+    :param max_terms_in_memory: Optional. Maximum number of distinct terms to keep in memory. Defaults to no limit.
+    :param spill_dir: Optional. Directory for the temporary files. Defaults to the system's temp directory.
+
+    :return: Iterator over one Input per distinct term, longest first
+            (within each partition, if the entries had to be spilled to disk)
+    """
+    if max_terms_in_memory is not None and max_terms_in_memory <= 0:
+        raise ValueError("'max_terms_in_memory' must be greater than 0")
+
+    return _aggregate(((entry.query, entry.score) for entry in entries), max_terms_in_memory, spill_dir, level=0)
+
+
+def _aggregate(entries: Iterable[Tuple[str, float]], max_terms_in_memory: int, spill_dir: str,
+               level: int) -> Iterator[Input]:
+    """
+    :param entries: (term, score) pairs to aggregate
+    :param max_terms_in_memory: maximum number of distinct terms to keep in memory, None for no limit
+    :param spill_dir: directory for the temporary files
+    :param level: recursion depth, used to partition the terms differently on each level
+
+    :return: Iterator over one Input per distinct term
+    """
+    scores: Dict[str, float] = {}
+    spill_files: List = []
+
+    try:
+        for term, score in entries:
+            if term in scores:
+                scores[term] += score
+            else:
+                scores[term] = score
+
+                if max_terms_in_memory is not None and len(scores) > max_terms_in_memory:
+                    if not spill_files:
+                        spill_files = [tempfile.TemporaryFile(dir=spill_dir) for _ in range(NUM_SPILL_PARTITIONS)]
+                    _spill(scores, spill_files, level)
+                    scores = {}
+
+        if not spill_files:
+            # longest first, makes insert faster
+            for term in sorted(scores, key=len, reverse=True):
+                yield Input(term, scores[term])
+            return
+
+        _spill(scores, spill_files, level)
+        scores = {}
+
+        logging.info(f'Aggregation exceeded {max_terms_in_memory} distinct terms,'
+                     f' aggregating {len(spill_files)} partitions from disk (level {level})')
+
+        for spill_file in spill_files:
+            spill_file.seek(0)
+
+            # give up the memory bound if re-partitioning does not split the terms any further
+            max_terms_in_partition: int = max_terms_in_memory if level + 1 < MAX_SPILL_LEVELS else None
+
+            yield from _aggregate(_read_spilled(spill_file), max_terms_in_partition, spill_dir, level + 1)
+
+            spill_file.close()
+    finally:
+        for spill_file in spill_files:
+            spill_file.close()
+
+
+def _spill(scores: Dict[str, float], spill_files: List, level: int) -> None:
+    """
+    Append the partially aggregated scores to the spill files, partitioned by the hash of the term.
+    """
+    partitions: List[List[Tuple[str, float]]] = [[] for _ in spill_files]
+
+    for term, score in scores.items():
+        partitions[hash((level, term)) % len(spill_files)].append((term, score))
+
+    for partition, spill_file in zip(partitions, spill_files):
+        if partition:
+            pickle.dump(partition, spill_file, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def _read_spilled(spill_file) -> Iterator[Tuple[str, float]]:
+    """
+    Read back all (term, score) pairs that were spilled into the file.
+    """
+    while True:
+        try:
+            partition: List[Tuple[str, float]] = pickle.load(spill_file)
+        except EOFError:
+            return
+
+        yield from partition
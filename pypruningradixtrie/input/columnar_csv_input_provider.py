@@ -0,0 +1,129 @@
+import csv
+import logging
+from itertools import islice
+from typing import TYPE_CHECKING, Callable, Dict, List, Sequence, Tuple
+
+from pypruningradixtrie.input.abstract_input_provider import AbstractInputProvider
+from pypruningradixtrie.input.input import Input
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+class ColumnarCSVInputProvider(AbstractInputProvider):
+    """
+    InputProvider that uses CSV as source and parses it column-wise in chunks with NumPy.
+    Requires the optional dependency 'numpy'.
+    Fields must not contain line breaks.
+    """
+
+    def __init__(self, seperator: str, term_index: int = 0, score_indices: Sequence[int] = (1,),
+                 score_fun: Callable[..., "np.ndarray"] = None, chunk_size: int = 200_000):
+        """
+        :param seperator: separator for CSV entries
+        :param term_index: index in CSV line where term to insert into trie is located
+        :param score_indices: indices in CSV line of the numeric columns the score is calculated from
+        :param score_fun: vectorized function that gets one float array per score column (in the order of
+                score_indices) and returns an array with the scores. Defaults to the first score column.
+        :param chunk_size: number of lines that are parsed at once
+
+        :return InputProvider that reads CSV column-wise
+        """
+        self.seperator: str = seperator
+        self.term_index: int = term_index
+        self.score_indices: Sequence[int] = score_indices
+        self.score_fun: Callable[..., "np.ndarray"] = score_fun or (lambda scores, *_: scores)
+        self.chunk_size: int = chunk_size
+
+    def read_input_data(self, file_path: str) -> List[Input]:
+        """
+        :param file_path: path to input file
+
+        :return: List of Input objects, duplicated terms are aggregated into one entry
+        """
+        terms, scores = self.read_input_columns(file_path)
+
+        return [Input(term, score) for term, score in zip(terms.tolist(), scores.tolist())]
+
+    def read_input_columns(self, file_path: str) -> Tuple["np.ndarray", "np.ndarray"]:
+        """
+        Read the terms and scores from the file without creating an object per line.
+        The scores of duplicated terms are summed up, like 'insert_term' does it.
+
+        :param file_path: path to input file
+
+        :return: tuple of arrays with the distinct terms (dtype object) & their scores, longest term first
+        """
+        import numpy as np
+
+        read_success_count: int = 0
+        read_error_count: int = 0
+
+        term_scores: Dict[str, float] = {}
+        get_score = term_scores.get
+
+        with self.open_file_stream(file_path) as f:
+            # skip header
+            next(f, None)
+
+            while True:
+                lines: List[str] = list(islice(f, self.chunk_size))
+                if not lines:
+                    break
+
+                terms, scores, error_count = self.__read_chunk(lines)
+
+                for term, score in zip(terms.tolist(), scores.tolist()):
+                    term_scores[term] = get_score(term, 0.0) + score
+
+                read_success_count += len(terms)
+                read_error_count += error_count
+
+        logging.info(f'Finished loading {read_success_count} entries from path {file_path}.'
+                     f' Encountered {read_error_count} errors')
+
+        # longest first, makes insert faster
+        distinct_terms: List[str] = sorted(term_scores, key=len, reverse=True)
+
+        return (np.fromiter(distinct_terms, dtype=object, count=len(distinct_terms)),
+                np.fromiter(map(term_scores.__getitem__, distinct_terms), dtype=np.float64, count=len(distinct_terms)))
+
+    def __read_chunk(self, lines: List[str]) -> Tuple["np.ndarray", "np.ndarray", int]:
+        """
+        :param lines: the raw CSV lines of this chunk
+
+        :return: tuple of the terms & scores of all valid lines and the number of invalid lines
+        """
+        import numpy as np
+
+        # the terms become python strings right away, fixed-width unicode arrays would be padded to the longest term
+        dtype: List[Tuple[str, type]] = [('term', object)] + [(f'score_{i}', np.float64)
+                                                              for i in range(len(self.score_indices))]
+        try:
+            columns: np.ndarray = np.loadtxt(lines, dtype=dtype, delimiter=self.seperator, quotechar='"',
+                                             comments=None, usecols=(self.term_index, *self.score_indices), ndmin=1)
+        except ValueError:
+            # at least one line is invalid, fall back to checking line by line
+            valid_lines: List[str] = [line for line in lines if self.__is_valid(line)]
+            if len(valid_lines) == len(lines):
+                raise
+            if not valid_lines:
+                return np.array([], dtype=object), np.array([], dtype=np.float64), len(lines)
+
+            terms, scores, _ = self.__read_chunk(valid_lines)
+
+            return terms, scores, len(lines) - len(valid_lines)
+
+        score_columns: List[np.ndarray] = [columns[name] for name, _ in dtype[1:]]
+
+        return columns['term'], np.asarray(self.score_fun(*score_columns), dtype=np.float64), 0
+
+    def __is_valid(self, line: str) -> bool:
+        try:
+            fields: List[str] = next(csv.reader([line], delimiter=self.seperator))
+            fields[self.term_index]
+            for index in self.score_indices:
+                float(fields[index])
+            return True
+        except (IndexError, ValueError, StopIteration):
+            return False
@@ -1,6 +1,6 @@
 import csv
 import logging
-from typing import List, Callable
+from typing import Iterator, List, Callable
 
 from pypruningradixtrie.input.abstract_input_provider import AbstractInputProvider
 from pypruningradixtrie.input.input import Input
@@ -29,11 +29,18 @@ class CSVInputProvider(AbstractInputProvider):
 
         :return: List of Input objects
         """
+        # longest first, makes insert faster
+        return sorted(self.iter_input_data(file_path), key=lambda x: len(x.query), reverse=True)
+
+    def iter_input_data(self, file_path: str) -> Iterator[Input]:
+        """
+        :param file_path: path to input file
+
+        :return: Iterator over the Input objects, in the order of the file
+        """
         read_success_count: int = 0
         read_error_count: int = 0
 
-        entries: List[Input] = []
-
         with self.open_file_stream(file_path) as f:
             reader = csv.reader(f, delimiter=self.seperator)
             # skip header
@@ -41,13 +48,13 @@ class CSVInputProvider(AbstractInputProvider):
 
             for line in reader:
                 try:
-                    entries.append(Input(line[self.term_index], self.score_fun(line)))
+                    entry: Input = Input(line[self.term_index], self.score_fun(line))
                     read_success_count += 1
                 except Exception as _:
                     read_error_count += 1
+                    continue
+
+                yield entry
 
         logging.info(f'Finished loading {read_success_count} entries from path {file_path}.'
                      f' Encountered {read_error_count} errors')
-
-        # longest first, makes insert faster
-        return sorted(entries, key=lambda x: len(x.query), reverse=True)
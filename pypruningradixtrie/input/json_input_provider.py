@@ -1,6 +1,6 @@
 import json
 import logging
-from typing import List, Callable, Any, Dict
+from typing import Iterator, List, Callable, Any, Dict
 
 from pypruningradixtrie.input.abstract_input_provider import AbstractInputProvider
 from pypruningradixtrie.input.input import Input
@@ -27,23 +27,30 @@ class JSONInputProvider(AbstractInputProvider):
 
         :return: List of Input objects
         """
+        # longest first, makes insert faster
+        return sorted(self.iter_input_data(file_path), key=lambda x: len(x.query), reverse=True)
+
+    def iter_input_data(self, file_path: str) -> Iterator[Input]:
+        """
+        :param file_path: path to input file
+
+        :return: Iterator over the Input objects, in the order of the file
+        """
         read_success_count: int = 0
         read_error_count: int = 0
 
-        entries: List[Input] = []
-
         with self.open_file_stream(file_path) as f:
             json_data = json.load(f)
 
             for entry in json_data["data"]:
                 try:
-                    entries.append(Input(entry[self.key_for_term], self.score_fun(entry)))
+                    input: Input = Input(entry[self.key_for_term], self.score_fun(entry))
                     read_success_count += 1
                 except Exception as _:
                     read_error_count += 1
+                    continue
+
+                yield input
 
         logging.info(f'Finished loading {read_success_count} entries from path {file_path}.'
                      f' Encountered {read_error_count} errors')
-
-        # longest first, makes insert faster
-        return sorted(entries, key=lambda x: len(x.query), reverse=True)
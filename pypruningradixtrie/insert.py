@@ -1,20 +1,36 @@
-from typing import List, Tuple
+from sys import intern
+from typing import TYPE_CHECKING, Iterable, List, Tuple
 
+from pypruningradixtrie.accelerator import calc_shared_prefix_len, find_child_index
 from pypruningradixtrie.input.abstract_input_provider import AbstractInputProvider
+from pypruningradixtrie.input.aggregation import aggregate_input
+from pypruningradixtrie.input.columnar_csv_input_provider import ColumnarCSVInputProvider
 from pypruningradixtrie.input.input import Input
 from pypruningradixtrie.trie import PruningRadixTrie
 from pypruningradixtrie.trie_node import TrieNode
 
+if TYPE_CHECKING:
+    import numpy as np
 
-def fill_trie_from_file(trie: PruningRadixTrie, path: str, input_provider: AbstractInputProvider) -> None:
+
+def fill_trie_from_file(trie: PruningRadixTrie, path: str, input_provider: AbstractInputProvider,
+                        aggregate: bool = False, max_terms_in_memory: int = None) -> None:
     """
     Fill the trie with entries from a file.
 
     :param trie: the trie to fill
     :param path: location of the input file that should be read
     :param input_provider: needs to match the file type of the 2nd parameter
+    :param aggregate: Optional. Sum up the scores of duplicated terms before inserting them,
+            so that each distinct term is inserted only once. Defaults to False.
+    :param max_terms_in_memory: Optional. Only used with aggregate. Maximum number of distinct terms to
+            aggregate in memory, the rest is spilled to disk. Defaults to no limit.
     """
-    input: List[Input] = input_provider.read_input_data(path)
+    input: Iterable[Input]
+    if aggregate:
+        input = aggregate_input(input_provider.iter_input_data(path), max_terms_in_memory)
+    else:
+        input = input_provider.read_input_data(path)
 
     def insert_term_with_defaults(term: str, score: float):
         insert_term(trie, term, score, trie._root, [])
@@ -23,6 +39,32 @@ def fill_trie_from_file(trie: PruningRadixTrie, path: str, input_provider: Abstr
         insert_term_with_defaults(entry.query, entry.score)
 
 
+def fill_trie_from_columnar_file(trie: PruningRadixTrie, path: str, input_provider: ColumnarCSVInputProvider) -> None:
+    """
+    Fill the trie with entries from a file, reading it column-wise.
+    Duplicated terms are aggregated before insertion, so each distinct term is inserted once.
+
+    :param trie: the trie to fill
+    :param path: location of the CSV file that should be read
+    :param input_provider: provider that reads the file into arrays
+    """
+    terms, scores = input_provider.read_input_columns(path)
+
+    fill_trie_from_columns(trie, terms, scores)
+
+
+def fill_trie_from_columns(trie: PruningRadixTrie, terms: "np.ndarray", scores: "np.ndarray") -> None:
+    """
+    Fill the trie with entries from parallel arrays.
+
+    :param trie: the trie to fill
+    :param terms: the terms to insert, longest first makes insert faster
+    :param scores: the score of the term at the same position
+    """
+    for term, score in zip(terms.tolist(), scores.tolist()):
+        insert_term(trie, term, score, trie._root, [])
+
+
 def __update_max_scores(nodes: List[TrieNode], term_score: float) -> None:
     """
     Update the max_score_children of all the nodes, if the given term_score is higher.
@@ -40,6 +82,10 @@ def insert_term(trie: PruningRadixTrie, term: str, term_score: float,
     """
     Add a single entry to the trie.
     If the term already exist, the term_score gets added to the existing score.
+    The prefixes that are split off existing edge labels are interned, so that identical ones in different branches
+    share one string. The remaining labels are mostly unique suffixes, interning them would only cost time.
+    The term_score is converted to the score precision of the trie. Terms with a score of 0 are not inserted,
+    a node with score 0 does not end a word.
 
     :param trie: the trie to fill
     :param term: the term to insert
@@ -49,76 +95,93 @@ def insert_term(trie: PruningRadixTrie, term: str, term_score: float,
             Defaults to Root node.
     :param parents: Optional. All the parent nodes from the given parent to the root node.
     """
+    term_score = trie._score_precision.quantize(term_score)
+    if term_score == 0:
+        return
+
     if parents is None:
         parents = []
     if parent_node is None:
         parent_node = trie._root
 
+    __insert_term(trie, term, term_score, parent_node, parents)
+
+
+def __insert_term(trie: PruningRadixTrie, term: str, term_score: float,
+                  parent_node: TrieNode, parents: List[TrieNode]) -> None:
+    """
+    Recursive part of 'insert_term', the term_score is already converted to the score precision of the trie.
+    The sum of two scores in that precision does not need to be converted again.
+
+    :param trie: the trie to fill
+    :param term: the term to insert
+    :param term_score: the score of the new term, must not be 0
+    :param parent_node: The node in the trie where this term should start.
+    :param parents: All the parent nodes from the given parent to the root node.
+    """
     parents.append(parent_node)
 
-    shared_prefix_length: int = 0
+    # test whether the new child shares a prefix with an existing one
+    j: int = find_child_index(parent_node.children, term)
 
-    # test whether the new child shares a prefix with existing ones
-    if parent_node.has_children():
-        for j in range(0, len(parent_node.children)):
-            entry: Tuple[str, TrieNode] = parent_node.children[j]
-            key: str = entry[0]
-            node: TrieNode = entry[1]
+    if j >= 0:
+        entry: Tuple[str, TrieNode] = parent_node.children[j]
+        key: str = entry[0]
+        node: TrieNode = entry[1]
 
-            shared_prefix_length += __calc_shared_prefix_len(term, key)
+        shared_prefix_length: int = calc_shared_prefix_len(term, key)
 
-            if shared_prefix_length > 0:
-                # term already in trie
-                # existing: flower
-                # new:      flower
-                if shared_prefix_length == len(term) and shared_prefix_length == len(key):
-                    if node.get_score() == 0:
-                        trie._term_count += 1
+        # term already in trie
+        # existing: flower
+        # new:      flower
+        if shared_prefix_length == len(term) and shared_prefix_length == len(key):
+            if node.get_score() == 0:
+                trie._term_count += 1
 
-                    node.add_to_score(term_score)
+            node.set_score(node.get_score() + term_score)
 
-                    __update_max_scores(parents, node.get_score())
+            __update_max_scores(parents, node.get_score())
 
-                # new term is substring of existing key -> new branch
-                # existing: flower
-                # new:      flow
-                elif shared_prefix_length == len(term):
-                    child: TrieNode = TrieNode(term_score)
+        # new term is substring of existing key -> new branch
+        # existing: flower
+        # new:      flow
+        elif shared_prefix_length == len(term):
+            child: TrieNode = TrieNode(term_score)
 
-                    child.children = [(key[shared_prefix_length:], node)]
+            child.children = [(key[shared_prefix_length:], node)]
 
-                    child.max_score_children = max([node.get_score(), node.max_score_children])
-                    __update_max_scores(parents, term_score)
+            child.max_score_children = max([node.get_score(), node.max_score_children])
+            __update_max_scores(parents, term_score)
 
-                    parent_node.replace_child(term[0:shared_prefix_length], child, index=j)
+            parent_node.replace_child(intern(term[0:shared_prefix_length]), child, index=j)
 
-                    trie._term_count += 1
+            trie._term_count += 1
 
-                # existing key is substring of new term -> term has to be added at lower level
-                # existing: flower
-                # new:      flower power
-                elif shared_prefix_length == len(key):
-                    insert_term(trie, term[shared_prefix_length:], term_score, node, parents)
+        # existing key is substring of new term -> term has to be added at lower level
+        # existing: flower
+        # new:      flower power
+        elif shared_prefix_length == len(key):
+            __insert_term(trie, term[shared_prefix_length:], term_score, node, parents)
 
-                # new and existing term share a prefix, but have different suffixes
-                # existing: flower
-                # new:      flowchart
-                else:
-                    child: TrieNode = TrieNode(0)
-                    child.children = [
-                        (key[shared_prefix_length:], node),
-                        (term[shared_prefix_length:], TrieNode(term_score))
-                    ]
+        # new and existing term share a prefix, but have different suffixes
+        # existing: flower
+        # new:      flowchart
+        else:
+            child: TrieNode = TrieNode(0)
+            child.children = [
+                (key[shared_prefix_length:], node),
+                (term[shared_prefix_length:], TrieNode(term_score))
+            ]
 
-                    child.max_score_children = max(node.max_score_children, term_score, node.get_score())
+            child.max_score_children = max(node.max_score_children, term_score, node.get_score())
 
-                    __update_max_scores(parents, term_score)
+            __update_max_scores(parents, term_score)
 
-                    parent_node.replace_child(term[0:shared_prefix_length], child, index=j)
+            parent_node.replace_child(intern(term[0:shared_prefix_length]), child, index=j)
 
-                    trie._term_count += 1
+            trie._term_count += 1
 
-                return
+        return
 
     # parent had no children, just add the new term
     parent_node.add_child(term, TrieNode(term_score))
@@ -127,19 +190,3 @@ def insert_term(trie: PruningRadixTrie, term: str, term_score: float,
 
     __update_max_scores(parents, term_score)
 
-
-def __calc_shared_prefix_len(term1: str, term2: str) -> int:
-    """
-    Determines the number of shared characters from the start between the given terms.
-
-    :return: An Integer in the range from 0 to n (= length of shorter term)
-    """
-    len_shared: int = 0
-
-    for i in range(0, min(len(term1), len(term2))):
-        if term1[i] == term2[i]:
-            len_shared = i + 1
-        else:
-            break
-
-    return len_shared
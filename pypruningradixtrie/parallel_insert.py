@@ -0,0 +1,323 @@
+import gc
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from operator import itemgetter
+from typing import Dict, Hashable, List, Tuple
+
+from pypruningradixtrie.accelerator import find_child_index
+from pypruningradixtrie.input.abstract_input_provider import AbstractInputProvider
+from pypruningradixtrie.input.input import Input
+from pypruningradixtrie.insert import insert_term
+from pypruningradixtrie.score_precision import ScorePrecision
+from pypruningradixtrie.trie import PruningRadixTrie
+from pypruningradixtrie.trie_node import TrieNode
+
+# number of shards created per worker, more shards than workers balance out uneven shard sizes
+SHARDS_PER_WORKER: int = 4
+
+# flat encoding of a sub-trie that is cheap to send between processes:
+# (labels, scores, max_scores_children, numbers of children) of all nodes in pre-order, root first
+EncodedTrie = Tuple[List[str], List[float], List[float], List[int]]
+
+# an entry together with its position in the input: (index, term, score)
+IndexedEntry = Tuple[int, str, float]
+
+# how inserting the entry at the input index changed the root child of its term's first character:
+# (index, first character, whether the child is new or got a new label, max_score_children of the child)
+RootChildChange = Tuple[int, str, bool, float]
+
+
+def fill_trie_from_file_parallel(trie: PruningRadixTrie, path: str, input_provider: AbstractInputProvider,
+                                 num_workers: int = None) -> None:
+    """
+    Fill the trie with entries from a file, building independent sub-tries in parallel worker processes.
+
+    Terms that start with different characters never share a node below the root,
+    so the entries are partitioned by their first character, each partition is inserted into its own
+    sub-trie by a worker and the resulting branches are attached to the root of the given trie.
+
+    :param trie: the trie to fill
+    :param path: location of the input file that should be read
+    :param input_provider: needs to match the file type of the 2nd parameter
+    :param num_workers: Optional. Number of worker processes. Defaults to the number of CPU cores.
+    """
+    input: List[Input] = input_provider.read_input_data(path)
+
+    fill_trie_parallel(trie, input, num_workers)
+
+
+def fill_trie_parallel(trie: PruningRadixTrie, input: List[Input], num_workers: int = None) -> None:
+    """
+    Fill the trie with the given entries, building independent sub-tries in parallel worker processes.
+    The result is the same as inserting the entries one by one in the given order,
+    including the order of the root children, which decides the order of results with equal scores.
+
+    :param trie: the trie to fill
+    :param input: the entries to insert, they are inserted in the given order within each sub-trie
+    :param num_workers: Optional. Number of worker processes. Defaults to the number of CPU cores.
+    """
+    if num_workers is None:
+        num_workers = os.cpu_count() or 1
+    if num_workers <= 0:
+        raise ValueError("'num_workers' must be greater than 0")
+
+    entries_by_first_char: Dict[str, List[IndexedEntry]] = {}
+    for index, entry in enumerate(input):
+        entries_by_first_char.setdefault(entry.query[:1], []).append((index, entry.query, entry.score))
+
+    # labels & max_score_children of the root children, before any entry is inserted
+    initial_root_children: List[Tuple[str, float]] = [(key, node.max_score_children)
+                                                      for key, node in trie._root.children]
+
+    # branches that already exist below the root cannot be built independently,
+    # insert their entries directly into the existing trie.
+    # Same for empty terms, they never share a node and are inserted like 'insert_term' does it.
+    existing_first_chars = {key[:1] for key, _ in trie._root.children} | {""}
+    existing_entries: List[IndexedEntry] = [
+        entry for first_char in existing_first_chars & entries_by_first_char.keys()
+        for entry in entries_by_first_char.pop(first_char)
+    ]
+    changes: List[RootChildChange] = _insert_entries(trie, existing_entries)
+
+    shards: List[List[IndexedEntry]] = _create_shards(entries_by_first_char, num_workers * SHARDS_PER_WORKER)
+
+    if num_workers == 1 or len(shards) <= 1:
+        sub_tries: List[Tuple[List[Tuple[str, TrieNode]], int]] = []
+        for shard in shards:
+            root, term_count, shard_changes = _build_sub_trie(shard, trie._score_precision)
+            sub_tries.append((root.children, term_count))
+            changes.extend(shard_changes)
+    else:
+        with ProcessPoolExecutor(max_workers=num_workers) as executor:
+            # the workers send flat lists instead of the node graph, pickling that is several times faster
+            sub_tries = []
+            for encoded_trie, term_count, shard_changes in executor.map(_build_encoded_sub_trie, shards,
+                                                                         repeat(trie._score_precision)):
+                sub_tries.append((_decode_trie(encoded_trie).children, term_count))
+                changes.extend(shard_changes)
+
+    _attach_sub_tries(trie, sub_tries, _sequential_root_order(initial_root_children, changes))
+
+
+def _create_shards(entries_by_first_char: Dict[str, List[IndexedEntry]], num_shards: int) -> List[List[IndexedEntry]]:
+    """
+    Group the partitions into at most num_shards shards of similar size.
+    Largest partitions are assigned first, always to the currently smallest shard.
+
+    :param entries_by_first_char: the entries, partitioned by the first character of their term
+    :param num_shards: the maximum number of shards to create
+
+    :return: list of shards, each containing all entries of one or more first characters
+    """
+    shards: List[List[IndexedEntry]] = [[] for _ in range(min(num_shards, len(entries_by_first_char)))]
+
+    partitions = sorted(entries_by_first_char.values(), key=len, reverse=True)
+    for partition in partitions:
+        smallest_shard: List[IndexedEntry] = min(shards, key=len)
+        smallest_shard.extend(partition)
+
+    return shards
+
+
+def _build_sub_trie(entries: List[IndexedEntry],
+                    score_precision: ScorePrecision) -> Tuple[TrieNode, int, List[RootChildChange]]:
+    """
+    Build a trie from the given entries. Runs inside the worker processes.
+
+    :param entries: the entries to insert, in the order of the input
+    :param score_precision: the score precision of the trie the sub-trie gets attached to
+    :return: tuple of the root node of the new trie, the number of terms in it & the changes of its root children
+    """
+    sub_trie: PruningRadixTrie = PruningRadixTrie(score_precision=score_precision)
+
+    changes: List[RootChildChange] = _insert_entries(sub_trie, entries)
+
+    return sub_trie._root, sub_trie.get_num_entries(), changes
+
+
+def _build_encoded_sub_trie(entries: List[IndexedEntry],
+                            score_precision: ScorePrecision) -> Tuple[EncodedTrie, int, List[RootChildChange]]:
+    """
+    Same as '_build_sub_trie', but returns the sub-trie in the flat encoding of '_encode_trie'.
+    """
+    root, term_count, changes = _build_sub_trie(entries, score_precision)
+
+    return _encode_trie(root), term_count, changes
+
+
+def _insert_entries(trie: PruningRadixTrie, entries: List[IndexedEntry]) -> List[RootChildChange]:
+    """
+    Insert the entries and record how each insert changed the root child of the term's first character.
+    The children of the root are only sorted when a child is added or gets a new label,
+    '_sequential_root_order' needs these changes to replay that.
+
+    :param trie: the trie to insert the entries into
+    :param entries: the entries to insert, in the order of the input
+    :return: the changes of the root children, one at most per entry
+    """
+    changes: List[RootChildChange] = []
+    last_states: Dict[str, Tuple[str, float]] = {
+        key[:1]: (key, node.max_score_children) for key, node in trie._root.children if key
+    }
+
+    for index, term, score in entries:
+        term_count: int = trie._term_count
+
+        insert_term(trie, term, score, trie._root, [])
+
+        if not term:
+            # every empty term becomes a new child of the root, without children of its own
+            if trie._term_count > term_count:
+                changes.append((index, "", True, 0))
+            continue
+
+        j: int = find_child_index(trie._root.children, term)
+        if j < 0:
+            # the score was 0, the term was not inserted
+            continue
+
+        key, node = trie._root.children[j]
+        last_state = last_states.get(term[0])
+
+        if last_state is None or last_state != (key, node.max_score_children):
+            changes.append((index, term[0], last_state is None or last_state[0] != key, node.max_score_children))
+            last_states[term[0]] = (key, node.max_score_children)
+
+    return changes
+
+
+def _sequential_root_order(initial_root_children: List[Tuple[str, float]],
+                           changes: List[RootChildChange]) -> List[Hashable]:
+    """
+    Replay the sorts of the root children, that inserting all entries one by one into the trie would have done.
+    The children are sorted stable by max_score_children, but only when a child is added or gets a new label.
+    So the order of children with equal max_score_children depends on the order of the inserts.
+
+    :param initial_root_children: labels & max_score_children of the children of the root,
+            before the entries were inserted
+    :param changes: the changes of the root children of all inserts, in any order
+    :return: the first characters of the root children in sequential order,
+            empty terms are identified by ("", n) for the n-th empty term child
+    """
+    num_empty_terms: int = 0
+    order: List[Hashable] = []
+    max_scores_children: Dict[Hashable, float] = {}
+
+    for key, max_score_children in initial_root_children:
+        if key:
+            child_id: Hashable = key[:1]
+        else:
+            child_id = ("", num_empty_terms)
+            num_empty_terms += 1
+
+        order.append(child_id)
+        max_scores_children[child_id] = max_score_children
+
+    for _, first_char, label_changed, max_score_children in sorted(changes, key=itemgetter(0)):
+        if first_char:
+            child_id = first_char
+        else:
+            child_id = ("", num_empty_terms)
+            num_empty_terms += 1
+
+        is_new_child: bool = child_id not in max_scores_children
+        max_scores_children[child_id] = max_score_children
+
+        if label_changed:
+            if is_new_child:
+                order.append(child_id)
+            order.sort(key=max_scores_children.__getitem__, reverse=True)
+
+    return order
+
+
+def _encode_trie(root: TrieNode) -> EncodedTrie:
+    """
+    :param root: the root of the (sub-)trie to encode
+    :return: labels, scores, max_scores_children & numbers of children of all nodes in pre-order, root first
+    """
+    labels: List[str] = []
+    scores: List[float] = []
+    max_scores_children: List[float] = []
+    num_children: List[int] = []
+
+    stack: List[Tuple[str, TrieNode]] = [("", root)]
+    while stack:
+        label, node = stack.pop()
+
+        labels.append(label)
+        scores.append(node.get_score())
+        max_scores_children.append(node.max_score_children)
+        num_children.append(len(node.children))
+
+        # reversed, so that the first child is encoded first
+        stack.extend(reversed(node.children))
+
+    return labels, scores, max_scores_children, num_children
+
+
+def _decode_trie(encoded_trie: EncodedTrie) -> TrieNode:
+    """
+    :param encoded_trie: a trie encoded by '_encode_trie'
+    :return: the root node of the decoded trie, children keep their order
+    """
+    labels, scores, max_scores_children, num_children = encoded_trie
+
+    # creating the nodes does not create any garbage, but triggers lots of expensive collections
+    gc_was_enabled: bool = gc.isenabled()
+    gc.disable()
+
+    try:
+        nodes: List[TrieNode] = [TrieNode(score) for score in scores]
+
+        # parents that still wait for children, together with the number of missing children
+        open_parents: List[List] = []
+        for i, node in enumerate(nodes):
+            node.max_score_children = max_scores_children[i]
+
+            if open_parents:
+                parent = open_parents[-1]
+                parent[0].children.append((labels[i], node))
+                parent[1] -= 1
+                if parent[1] == 0:
+                    open_parents.pop()
+
+            if num_children[i] > 0:
+                open_parents.append([node, num_children[i]])
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+    return nodes[0]
+
+
+def _attach_sub_tries(trie: PruningRadixTrie, sub_tries: List[Tuple[List[Tuple[str, TrieNode]], int]],
+                      root_order: List[Hashable]) -> None:
+    """
+    Attach the branches of the sub-tries to the root of the trie and fix up max scores and child ordering.
+
+    :param trie: the trie to attach the branches to
+    :param sub_tries: tuples of root children & number of terms of the sub-tries
+    :param root_order: the order of the root children, as returned by '_sequential_root_order'
+    """
+    children: List[Tuple[str, TrieNode]] = list(trie._root.children)
+
+    for sub_trie_children, term_count in sub_tries:
+        children.extend(sub_trie_children)
+        trie._term_count += term_count
+
+    for _, node in children:
+        trie._root.max_score_children = max(trie._root.max_score_children, node.get_score(), node.max_score_children)
+
+    # empty term children keep their order, sorting the children is stable and they never get children themselves
+    children_by_id: Dict[Hashable, Tuple[str, TrieNode]] = {}
+    num_empty_terms: int = 0
+    for child in children:
+        if child[0]:
+            children_by_id[child[0][:1]] = child
+        else:
+            children_by_id[("", num_empty_terms)] = child
+            num_empty_terms += 1
+
+    trie._root.children = [children_by_id[child_id] for child_id in root_order]
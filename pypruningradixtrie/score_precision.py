@@ -0,0 +1,31 @@
+import math
+
+
+class ScorePrecision:
+    """
+    Defines the precision the scores are stored with in the trie.
+    The default keeps the scores as they are given (Python float = 64 bit).
+    """
+
+    def quantize(self, score: float) -> float:
+        """
+        Convert the given score into the precision of the trie.
+        Has to be idempotent, quantizing an already quantized score must not change it.
+        The sum of two quantized scores has to be a quantized score as well, it is not quantized again.
+
+        :param score: the score as given on insert
+        :return: the score as it is stored in the trie
+        """
+        return score
+
+
+class IntegerScorePrecision(ScorePrecision):
+    """
+    Rounds the scores to the nearest integer, halves away from zero, so that all score comparisons are
+    integer comparisons. Scale the scores in the 'score_fun' of the input provider to keep decimal places,
+    terms whose score rounds to 0 are not inserted.
+    """
+
+    def quantize(self, score: float) -> int:
+        # round() rounds halves to the even integer, i.e. 0.5 to 0
+        return int(math.copysign(math.floor(abs(score) + 0.5), score))
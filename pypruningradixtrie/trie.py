@@ -1,28 +1,36 @@
-from operator import attrgetter
-from typing import List
+from operator import itemgetter
+from typing import List, Tuple
 
+from pypruningradixtrie.accelerator import find_top_k
 from pypruningradixtrie.entry import Entry
 from pypruningradixtrie.input.abstract_input_provider import AbstractInputProvider
+from pypruningradixtrie.score_precision import ScorePrecision
 from pypruningradixtrie.trie_node import TrieNode
 
 
 def _add_to_results(child_node: TrieNode, child_term: str,
-                    prefix_string: str,
+                    branch_terms: List[str],
                     top_k: int,
-                    results: List[Entry]) -> None:
+                    results: List[Tuple[str, float]]) -> None:
     """
-    Add a new item to the list collecting the results. Remove an element if the number of results exceeds the top_k.
+    Add a new (term, score) item to the list collecting the results. Remove an element if the number of results exceeds the top_k.
 
     :param child_node: The node which was found
     :param child_term: The term which connects the child_node to its parent
-    :param prefix_string: The prefix gathered from all parents of the node
+    :param branch_terms: The terms of all parents of the node, starting at the root
     :param top_k: The number of results we want to collect
     :param results: The currently found results
     """
-    new_result: Entry = Entry(prefix_string + child_term, child_node.get_score())
+    score: float = child_node.get_score()
+
+    if len(results) >= top_k and score <= results[-1][1]:
+        # the new result would be sorted behind the last one and removed right away
+        return
+
+    new_result: Tuple[str, float] = ("".join(branch_terms) + child_term, score)
 
     results.append(new_result)
-    results.sort(key=attrgetter('score'), reverse=True)
+    results.sort(key=itemgetter(1), reverse=True)
 
     if len(results) > top_k:
         # we can just remove the last one because we only add one result at a time
@@ -32,17 +40,22 @@ def _add_to_results(child_node: TrieNode, child_term: str,
 class PruningRadixTrie:
     _term_count: int
     _root: TrieNode
+    _score_precision: ScorePrecision
 
-    def __init__(self, input_file_path: str = "", input_provider: AbstractInputProvider = None):
+    def __init__(self, input_file_path: str = "", input_provider: AbstractInputProvider = None,
+                 score_precision: ScorePrecision = None):
         """
         Crates a new PruningRadixTrie.
         Per default empty, use param for optional initialization with entries from file.
 
         :param input_file_path: path to a file to fill the trie from on creation
         :param input_provider: implementation of 'AbstractInputProvider' that should be used to read the given file
+        :param score_precision: Optional. Precision the scores are stored with, i.e. 'IntegerScorePrecision'.
+                Defaults to the scores as they are given.
         """
         self._root = TrieNode(0)
         self._term_count = 0
+        self._score_precision = score_precision or ScorePrecision()
 
         if input_file_path:
             if not input_provider:
@@ -67,32 +80,70 @@ class PruningRadixTrie:
 
         :return: A list of Entry objects with length in [0, top_k]
         """
+        return [Entry(term, score) for term, score in self.get_top_k_tuples_for_prefix(prefix, top_k)]
+
+    def get_top_k_tuples_for_prefix(self, prefix: str, top_k: int) -> List[Tuple[str, float]]:
+        """
+        Same as 'get_top_k_for_prefix', but returns plain (term, score) tuples instead of Entry objects.
+
+        :param prefix: The prefix all terms should start with
+        :param top_k: The number of results to return
+
+        :return: A list of (term, score) tuples with length in [0, top_k]
+        """
         if top_k <= 0:
             return []
 
-        results: List[Entry] = []
+        if find_top_k is not None and self._uses_default_pruning():
+            return find_top_k(self._root, prefix, top_k)
 
-        self.__find_all_child_terms(prefix, self._root, top_k, "", results)
+        results: List[Tuple[str, float]] = []
+
+        self.__find_all_child_terms(prefix, self._root, top_k, [], results)
 
         return results
 
+    def get_top_k_columns_for_prefix(self, prefix: str, top_k: int) -> Tuple[List[str], List[float]]:
+        """
+        Same as 'get_top_k_for_prefix', but returns the terms and the scores as parallel lists.
+
+        :param prefix: The prefix all terms should start with
+        :param top_k: The number of results to return
+
+        :return: A tuple of the list of terms & the list of their scores, both with length in [0, top_k]
+        """
+        results: List[Tuple[str, float]] = self.get_top_k_tuples_for_prefix(prefix, top_k)
+
+        return [term for term, _ in results], [score for _, score in results]
+
+    def _uses_default_pruning(self) -> bool:
+        """
+        :return: true if the pruning behaviour is not overridden by a subclass
+                    => the compiled top_k search of the accelerator module can be used
+        """
+        cls = type(self)
+
+        return cls._should_skip_node_and_all_children is PruningRadixTrie._should_skip_node_and_all_children \
+            and cls._should_skip_all_children_of_node is PruningRadixTrie._should_skip_all_children_of_node
+
     def __find_all_child_terms(self,
                                prefix_to_restrict_children: str,
                                base_node: TrieNode,
                                top_k: int,
-                               current_branch_term: str,
-                               results: List[Entry]) -> None:
+                               branch_terms: List[str],
+                               results: List[Tuple[str, float]]) -> None:
         """
         :param prefix_to_restrict_children: restrict the selection of child nodes, they have to match this prefix
         :param base_node: place where we continue to look for children
         :param top_k: number of results that we want
-        :param current_branch_term: all prefixes that were collected on the branch up to this node
+        :param branch_terms: all prefixes that were collected on the branch up to this node
                 (each node only knows its string (i.e. "ower") not the string(s) before it
                 (i.e. "flow" & "er p" if the node is for "flower power").
-                So we need the current_branch_term in order to be able to construct the whole result term)
+                So we need the branch_terms in order to be able to construct the whole result term.
+                They are only joined for terms that make it into the results.)
         :param results: list of results that we want to return
 
-        :return: no explicit return, modifies given 'results'-param  to collect all entries
+        :return: no explicit return, modifies given 'results'-param  to collect all (term, score) tuples
                 that were found with the given prefix, maximum amount: top_k
         """
 
@@ -110,17 +161,19 @@ class PruningRadixTrie:
                 if should_not_restrict_children or child_term.startswith(prefix_to_restrict_children):
 
                     if child_node.is_word_end:
-                        _add_to_results(child_node, child_term, current_branch_term, top_k, results)
+                        _add_to_results(child_node, child_term, branch_terms, top_k, results)
 
                     if child_node.has_children():
                         # no restriction of children anymore because this node starts with the
                         # prefix that we entered
+                        branch_terms.append(child_term)
                         self.__find_all_child_terms(
                             prefix_to_restrict_children="",
                             base_node=child_node,
                             top_k=top_k,
-                            current_branch_term=current_branch_term + child_term,
+                            branch_terms=branch_terms,
                             results=results)
+                        branch_terms.pop()
 
                     # there is a prefix to restrict by and this child matched it
                     # => all other children cannot match, so skip them
@@ -135,12 +188,14 @@ class PruningRadixTrie:
                         # we look for 'flower power', this node is 'flower', only further restrict with ' power'
                         new_prefix_to_restrict_by: str = prefix_to_restrict_children[len(child_term):]
 
+                        branch_terms.append(child_term)
                         self.__find_all_child_terms(
                             prefix_to_restrict_children=new_prefix_to_restrict_by,
                             base_node=child_node,
                             top_k=top_k,
-                            current_branch_term=current_branch_term + child_term,
+                            branch_terms=branch_terms,
                             results=results)
+                        branch_terms.pop()
 
                     # the prefix to restrict by starts with this child
                     # => it cannot start with any other, so skip the other children
@@ -156,10 +211,10 @@ class PruningRadixTrie:
                 else:
                     break
 
-    def _should_skip_node_and_all_children(self, node: TrieNode, results: List[Entry], top_k: int) -> bool:
+    def _should_skip_node_and_all_children(self, node: TrieNode, results: List[Tuple[str, float]], top_k: int) -> bool:
         """
         :param node: root of possible new branch to look through
-        :param results: results that were already collected
+        :param results: (term, score) tuples that were already collected
         :param top_k: number of results that we want to collect
 
         :return: true if we should skip all children AND the score of this node is lower than the lowest in the results
@@ -170,15 +225,15 @@ class PruningRadixTrie:
         if not should_skip_all_children:
             return False
 
-        score_of_node_is_too_low: bool = node.get_score() <= results[top_k - 1].score
+        score_of_node_is_too_low: bool = node.get_score() <= results[top_k - 1][1]
 
         return score_of_node_is_too_low
 
     @staticmethod
-    def _should_skip_all_children_of_node(node: TrieNode, results: List[Entry], top_k: int) -> bool:
+    def _should_skip_all_children_of_node(node: TrieNode, results: List[Tuple[str, float]], top_k: int) -> bool:
         """
         :param node: root of possible new branch to look through
-        :param results: results that were already collected
+        :param results: (term, score) tuples that were already collected
         :param top_k: number of results that we want to collect
 
         :return: true if we have as many results as we want AND
@@ -189,7 +244,7 @@ class PruningRadixTrie:
         if not enough_results:
             return False
 
-        score_of_all_children_is_too_low: bool = node.max_score_children <= results[top_k - 1].score
+        score_of_all_children_is_too_low: bool = node.max_score_children <= results[top_k - 1][1]
 
         return score_of_all_children_is_too_low
 
@@ -4,6 +4,9 @@ from typing import List, Tuple
 
 @dataclasses.dataclass
 class TrieNode:
+    # no __dict__ per node, saves memory in big tries
+    __slots__ = ('__score', 'is_word_end', 'children', 'max_score_children')
+
     def __init__(self, score):
         self.__score: float = score
         self.is_word_end: bool = score > 0
@@ -14,6 +17,10 @@ class TrieNode:
     def get_score(self) -> float:
         return self.__score
 
+    def set_score(self, score) -> None:
+        self.__score = score
+        self.is_word_end = self.__score > 0
+
     def add_to_score(self, score) -> None:
         self.__score += score
         self.is_word_end = self.__score > 0
@@ -32,6 +39,16 @@ class TrieNode:
 
         self.__sort_children()
 
+    def add_children(self, children: List[Tuple[str, "TrieNode"]]) -> None:
+        """
+        Add several new children to the children of this node at once, sorting only once.
+
+        :param children: The (suffix, node) pairs that should be connected to this node
+        """
+        self.children = self.children + children
+
+        self.__sort_children()
+
     def replace_child(self, term: str, node, index: int) -> None:
         """
         Replace the child at index with a new child created from term and node.
@@ -44,6 +61,24 @@ class TrieNode:
 
         self.__sort_children()
 
+    def remove_child(self, node) -> None:
+        """
+        Remove the given child from the children of this node.
+
+        :param node: The child to remove
+        """
+        self.children = [(term, child) for term, child in self.children if child is not node]
+
+    def update_max_score_children(self) -> None:
+        """
+        Recalculate max_score_children from the direct children and restore the order of the children.
+        Used after scores below this node were lowered or removed, which 'insert_term' never does.
+        """
+        self.max_score_children = max((max(child.get_score(), child.max_score_children)
+                                       for _, child in self.children), default=0)
+
+        self.__sort_children()
+
     def has_children(self) -> bool:
         return len(self.children) > 0
 
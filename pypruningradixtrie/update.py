@@ -0,0 +1,265 @@
+import dataclasses
+import json
+import logging
+import os
+import tempfile
+from typing import Dict, List, Optional, Tuple
+
+from pypruningradixtrie.accelerator import find_child_index
+from pypruningradixtrie.input.abstract_input_provider import AbstractInputProvider
+from pypruningradixtrie.input.aggregation import aggregate_input
+from pypruningradixtrie.insert import insert_term
+from pypruningradixtrie.trie import PruningRadixTrie
+from pypruningradixtrie.trie_node import TrieNode
+
+
+@dataclasses.dataclass
+class InputDiff:
+    inserted: Dict[str, float]
+    changed: Dict[str, float]
+    deleted: List[str]
+
+
+def update_trie_from_file(trie: PruningRadixTrie, path: str, input_provider: AbstractInputProvider,
+                          previous_path: str = None, manifest_path: str = None) -> InputDiff:
+    """
+    Bring a trie that was filled from a previous version of the input up to date with the new input.
+    Only the terms that were inserted, changed or deleted since then are touched in the trie.
+
+    The previous scores are taken from the manifest, if it exists, otherwise from the previous input file.
+    Afterwards the manifest is (re-)written with the new scores, ready for the next update.
+
+    :param trie: the trie to update, has to contain the previous input
+    :param path: location of the new input file
+    :param input_provider: needs to match the file type of the input files
+    :param previous_path: Optional. Location of the input file the trie was filled from
+    :param manifest_path: Optional. Location of the manifest with the term scores the trie was filled with
+
+    :return: the changes that were applied to the trie
+    """
+    if manifest_path and os.path.exists(manifest_path):
+        previous_scores: Dict[str, float] = read_manifest(manifest_path)
+    elif previous_path:
+        previous_scores = read_term_scores(previous_path, input_provider)
+    else:
+        raise ValueError("You must provide a 'previous_path' or an existing 'manifest_path'")
+
+    new_scores: Dict[str, float] = read_term_scores(path, input_provider)
+
+    diff: InputDiff = diff_term_scores(previous_scores, new_scores)
+    apply_diff(trie, diff)
+
+    logging.info(f'Updated trie from path {path}: {len(diff.inserted)} inserted, {len(diff.changed)} changed,'
+                 f' {len(diff.deleted)} deleted terms')
+
+    if manifest_path:
+        write_manifest(manifest_path, new_scores)
+
+    return diff
+
+
+def read_term_scores(path: str, input_provider: AbstractInputProvider) -> Dict[str, float]:
+    """
+    :param path: location of the input file
+    :param input_provider: needs to match the file type of the 1st parameter
+
+    :return: the score of every distinct term in the file, scores of duplicated terms are summed up
+    """
+    return {entry.query: entry.score for entry in aggregate_input(input_provider.iter_input_data(path))}
+
+
+def read_manifest(path: str) -> Dict[str, float]:
+    """
+    :param path: location of a manifest written by 'write_manifest'
+
+    :return: the stored term scores
+    """
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+def write_manifest(path: str, term_scores: Dict[str, float]) -> None:
+    """
+    Store the term scores a trie was filled with, as JSON object.
+    The manifest is written to a temporary file next to it first, which then replaces the old one.
+    So a failed write leaves the previous manifest intact.
+
+    :param path: location of the manifest
+    :param term_scores: the score of every term in the trie
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)), suffix='.tmp')
+
+    try:
+        with os.fdopen(fd, 'w') as f:
+            json.dump(term_scores, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+
+
+def diff_term_scores(previous_scores: Dict[str, float], new_scores: Dict[str, float]) -> InputDiff:
+    """
+    :param previous_scores: the term scores the trie was filled with
+    :param new_scores: the term scores the trie should contain
+
+    :return: the terms that are new, the ones that got a different score & the ones that are gone
+    """
+    inserted: Dict[str, float] = {}
+    changed: Dict[str, float] = {}
+
+    for term, score in new_scores.items():
+        previous_score: Optional[float] = previous_scores.get(term)
+
+        if previous_score is None:
+            inserted[term] = score
+        elif previous_score != score:
+            changed[term] = score
+
+    deleted: List[str] = [term for term in previous_scores if term not in new_scores]
+
+    return InputDiff(inserted, changed, deleted)
+
+
+def apply_diff(trie: PruningRadixTrie, diff: InputDiff) -> None:
+    """
+    Apply the changes to the trie.
+
+    :param trie: the trie to update
+    :param diff: the changes, as returned by 'diff_term_scores'
+    """
+    for term in diff.deleted:
+        delete_term(trie, term)
+
+    for term, score in diff.changed.items():
+        set_term_score(trie, term, score)
+
+    # longest first, makes insert faster
+    for term in sorted(diff.inserted, key=len, reverse=True):
+        set_term_score(trie, term, diff.inserted[term])
+
+
+def set_term_score(trie: PruningRadixTrie, term: str, term_score: float) -> None:
+    """
+    Replace the score of a term in the trie. Inserts the term if it is not in the trie yet.
+    A term_score of 0 removes the term.
+
+    :param trie: the trie to update
+    :param term: the term to update
+    :param term_score: the new score of the term
+    """
+    term_score = trie._score_precision.quantize(term_score)
+
+    path: Optional[List[Tuple[TrieNode, str, TrieNode]]] = _find_path(trie, term)
+    if path is None or path[-1][2].get_score() == 0:
+        if term_score != 0:
+            insert_term(trie, term, term_score, trie._root, [])
+
+            # insert_term only raises the max scores on the path, restore the order of the children as well
+            _update_max_scores_on_path(trie, _find_path(trie, term) or [])
+        return
+
+    if term_score == 0:
+        delete_term(trie, term)
+        return
+
+    path[-1][2].set_score(term_score)
+
+    _update_max_scores_on_path(trie, path)
+
+
+def delete_term(trie: PruningRadixTrie, term: str) -> bool:
+    """
+    Remove a term from the trie. Nodes that are no longer needed are removed or merged with their only child.
+
+    :param trie: the trie to update
+    :param term: the term to remove
+
+    :return: true if the term was in the trie
+    """
+    path: Optional[List[Tuple[TrieNode, str, TrieNode]]] = _find_path(trie, term)
+    if path is None or path[-1][2].get_score() == 0:
+        return False
+
+    parent, key, node = path[-1]
+    node.set_score(0)
+    trie._term_count -= 1
+
+    if not node.has_children():
+        # flower power: remove the node
+        parent.remove_child(node)
+        path.pop()
+
+        # flower, flowchart: flow has only one child left, merge 'flow' & 'chart'
+        if path and not parent.is_word_end and len(parent.children) == 1:
+            grand_parent, parent_key, _ = path[-1]
+            _merge_with_only_child(grand_parent, parent_key, parent)
+    elif len(node.children) == 1:
+        # flower, flower power: merge 'flower' & ' power'
+        _merge_with_only_child(parent, key, node)
+
+    _update_max_scores_on_path(trie, path)
+
+    return True
+
+
+def _merge_with_only_child(parent: TrieNode, key: str, node: TrieNode) -> None:
+    """
+    Replace the node by its only child, the child's key gets prefixed with the key of the node.
+
+    :param parent: the parent of the node
+    :param key: the key that connects the node to its parent
+    :param node: the node to replace, must have exactly one child
+    """
+    child_key, child = node.children[0]
+
+    index: int = next(i for i, (_, existing) in enumerate(parent.children) if existing is node)
+    parent.replace_child(key + child_key, child, index=index)
+
+
+def _update_max_scores_on_path(trie: PruningRadixTrie, path: List[Tuple[TrieNode, str, TrieNode]]) -> None:
+    """
+    Recalculate max_score_children and the order of the children of all nodes on the path, bottom up.
+
+    :param trie: the trie the path belongs to
+    :param path: (parent, key, node) tuples from the root down to the changed node
+    """
+    for _, _, node in reversed(path):
+        node.update_max_score_children()
+
+    trie._root.update_max_score_children()
+
+
+def _find_path(trie: PruningRadixTrie, term: str) -> Optional[List[Tuple[TrieNode, str, TrieNode]]]:
+    """
+    :param trie: the trie to search
+    :param term: the term to find
+
+    :return: (parent, key, node) tuples from the root down to the node of the term or None if there is no such node
+    """
+    path: List[Tuple[TrieNode, str, TrieNode]] = []
+    parent: TrieNode = trie._root
+
+    if term == "":
+        # 'insert_term' adds an empty term as child with an empty key to the root
+        for key, node in parent.children:
+            if key == "":
+                return [(parent, key, node)]
+        return None
+
+    while term:
+        j: int = find_child_index(parent.children, term)
+        if j < 0:
+            return None
+
+        key, node = parent.children[j]
+        if not term.startswith(key):
+            return None
+
+        path.append((parent, key, node))
+        parent = node
+        term = term[len(key):]
+
+    return path or None
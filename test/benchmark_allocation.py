@@ -0,0 +1,87 @@
+"""
+Measures the memory allocations and the time spent in garbage collection while building and querying a trie.
+
+Usage: python -m test.benchmark_allocation [number of terms]
+
+Run it before and after a change to compare the numbers.
+"""
+import gc
+import random
+import sys
+import time
+import tracemalloc
+from typing import Callable, List, Tuple
+
+from pypruningradixtrie import accelerator
+from pypruningradixtrie.insert import insert_term
+from pypruningradixtrie.trie import PruningRadixTrie
+
+WORDS = ["flower", "power", "flow", "chart", "red", "blue", "garden", "seed", "pot", "rose", "tulip", "set",
+         "big", "small", "summer", "winter", "for", "with", "and", "the"]
+
+
+class GCTimer:
+    """
+    Sums up the time spent in garbage collection runs, using the callbacks of the gc module.
+    """
+
+    def __init__(self):
+        self.collections: int = 0
+        self.seconds: float = 0.0
+        self.__start: float = 0.0
+
+    def __call__(self, phase: str, info: dict) -> None:
+        if phase == "start":
+            self.__start = time.perf_counter()
+        else:
+            self.collections += 1
+            self.seconds += time.perf_counter() - self.__start
+
+
+def generate_terms(num_terms: int, seed: int = 42) -> List[Tuple[str, float]]:
+    rnd = random.Random(seed)
+
+    return [(" ".join(rnd.choice(WORDS) for _ in range(rnd.randint(1, 5))) + f" {rnd.randint(0, 99)}",
+             float(rnd.randint(1, 1000)))
+            for _ in range(num_terms)]
+
+
+def measure(name: str, fun: Callable[[], None]) -> None:
+    gc_timer = GCTimer()
+    gc.collect()
+    gc.callbacks.append(gc_timer)
+    tracemalloc.start()
+    start = time.perf_counter()
+
+    try:
+        fun()
+    finally:
+        seconds = time.perf_counter() - start
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        gc.callbacks.remove(gc_timer)
+
+    print(f"{name:<8} time: {seconds:8.3f}s   retained: {current / 2 ** 10:10.1f} KiB   peak: {peak / 2 ** 10:10.1f} KiB"
+          f"   gc runs: {gc_timer.collections:5d}   gc time: {gc_timer.seconds:6.3f}s")
+
+
+def main(num_terms: int) -> None:
+    terms = generate_terms(num_terms)
+    prefixes = [term[:length] for term, _ in terms[:2000] for length in (1, 3, 6)]
+    trie = PruningRadixTrie()
+
+    def build() -> None:
+        for term, score in terms:
+            insert_term(trie, term, score)
+
+    def query() -> None:
+        for prefix in prefixes:
+            trie.get_top_k_for_prefix(prefix, 10)
+
+    print(f"{num_terms} terms, {len(prefixes)} queries, accelerated: {accelerator.ACCELERATED}")
+    measure("build", build)
+    measure("query", query)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
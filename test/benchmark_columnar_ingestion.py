@@ -0,0 +1,55 @@
+"""
+Compares reading & filling a trie from a CSV file with duplicated terms, row-wise with aggregate=True
+and column-wise with the ColumnarCSVInputProvider. Requires numpy.
+
+Usage: python -m test.benchmark_columnar_ingestion [number of lines]
+
+Both modes insert every distinct term once, so they only differ in reading the file.
+The fill times are dominated by the inserts & the garbage collection they trigger, which varies
+by several seconds between runs, that's why the best of REPEAT runs is reported.
+"""
+import os
+import sys
+import tempfile
+import timeit
+from typing import Callable
+
+from pypruningradixtrie.input.aggregation import aggregate_input
+from pypruningradixtrie.input.columnar_csv_input_provider import ColumnarCSVInputProvider
+from pypruningradixtrie.input.csv_input_provider import CSVInputProvider
+from pypruningradixtrie.insert import fill_trie_from_columnar_file, fill_trie_from_file
+from pypruningradixtrie.trie import PruningRadixTrie
+from test.benchmark_allocation import generate_terms
+
+REPEAT = 3
+
+
+def measure(name: str, fun: Callable[[], None]) -> None:
+    seconds = min(timeit.repeat(fun, number=1, repeat=REPEAT))
+
+    print(f"{name:<16} {seconds:8.3f}s")
+
+
+def main(num_lines: int) -> None:
+    row_wise_provider = CSVInputProvider(',', lambda x: float(x[1]), 0)
+    columnar_provider = ColumnarCSVInputProvider(',')
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, 'data.csv')
+        with open(path, 'w') as f:
+            f.write("Term,Score\n")
+            for term, score in generate_terms(num_lines):
+                f.write(f"{term},{score:.0f}\n")
+
+        print(f"{num_lines} lines, best of {REPEAT} runs")
+
+        measure("read row-wise", lambda: list(aggregate_input(row_wise_provider.iter_input_data(path))))
+        measure("read columnar", lambda: columnar_provider.read_input_columns(path))
+
+        measure("fill row-wise", lambda: fill_trie_from_file(PruningRadixTrie(), path, row_wise_provider,
+                                                             aggregate=True))
+        measure("fill columnar", lambda: fill_trie_from_columnar_file(PruningRadixTrie(), path, columnar_provider))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 500_000)
@@ -0,0 +1,64 @@
+"""
+Measures the parallel trie build: the work done in the workers and the serial work left in the parent process.
+The serial part limits the speedup that more cores can give.
+
+Usage: python -m test.benchmark_parallel_insert [number of terms] [number of workers]
+"""
+import os
+import pickle
+import sys
+import time
+
+from pypruningradixtrie.input.input import Input
+from pypruningradixtrie.insert import insert_term
+from pypruningradixtrie.parallel_insert import (_build_encoded_sub_trie, _decode_trie, _sequential_root_order,
+                                                 fill_trie_parallel)
+from pypruningradixtrie.score_precision import ScorePrecision
+from pypruningradixtrie.trie import PruningRadixTrie
+from test.benchmark_allocation import generate_terms
+
+
+def timed(fun):
+    start = time.perf_counter()
+    result = fun()
+
+    return result, time.perf_counter() - start
+
+
+def main(num_terms: int, num_workers: int) -> None:
+    entries = sorted(generate_terms(num_terms), key=lambda x: len(x[0]), reverse=True)
+    input = [Input(term, score) for term, score in entries]
+
+    def sequential_build() -> None:
+        trie = PruningRadixTrie()
+        for term, score in entries:
+            insert_term(trie, term, score)
+
+    _, sequential_seconds = timed(sequential_build)
+
+    # the steps of one worker, all terms in a single shard
+    indexed_entries = [(index, term, score) for index, (term, score) in enumerate(entries)]
+    (encoded_trie, _, changes), worker_seconds = timed(lambda: _build_encoded_sub_trie(indexed_entries,
+                                                                                        ScorePrecision()))
+    data, dumps_seconds = timed(lambda: pickle.dumps((encoded_trie, 0, changes), protocol=pickle.HIGHEST_PROTOCOL))
+    (encoded_trie, _, changes), loads_seconds = timed(lambda: pickle.loads(data))
+    _, decode_seconds = timed(lambda: _decode_trie(encoded_trie))
+    _, order_seconds = timed(lambda: _sequential_root_order([], changes))
+
+    serial_seconds = loads_seconds + decode_seconds + order_seconds
+    _, parallel_seconds = timed(lambda: fill_trie_parallel(PruningRadixTrie(), input, num_workers))
+
+    print(f"{num_terms} terms, {len(encoded_trie[0])} nodes, {num_workers} workers, {os.cpu_count()} cores")
+    print(f"sequential build:           {sequential_seconds:8.3f}s")
+    print(f"worker build + encode:      {worker_seconds:8.3f}s")
+    print(f"worker pickle:              {dumps_seconds:8.3f}s   {len(data) / 2 ** 20:.1f} MiB")
+    print(f"parent unpickle:            {loads_seconds:8.3f}s")
+    print(f"parent decode:              {decode_seconds:8.3f}s")
+    print(f"parent root order:          {order_seconds:8.3f}s   {len(changes)} root child changes")
+    print(f"speedup ceiling:            {sequential_seconds / serial_seconds:8.1f}x")
+    print(f"fill_trie_parallel:         {parallel_seconds:8.3f}s")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000,
+         int(sys.argv[2]) if len(sys.argv) > 2 else os.cpu_count() or 1)
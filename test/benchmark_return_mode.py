@@ -0,0 +1,36 @@
+"""
+Compares the query throughput of the different return modes of the trie.
+
+Usage: python -m test.benchmark_return_mode [number of terms]
+"""
+import sys
+import timeit
+
+from pypruningradixtrie import accelerator
+from pypruningradixtrie.insert import insert_term
+from pypruningradixtrie.trie import PruningRadixTrie
+from test.benchmark_allocation import generate_terms
+
+TOP_K = 10
+
+
+def main(num_terms: int) -> None:
+    terms = generate_terms(num_terms)
+    prefixes = [term[:length] for term, _ in terms[:2000] for length in (1, 3, 6)]
+    trie = PruningRadixTrie()
+
+    for term, score in terms:
+        insert_term(trie, term, score)
+
+    print(f"{num_terms} terms, {len(prefixes)} queries, top_k: {TOP_K}, accelerated: {accelerator.ACCELERATED}")
+
+    for name, query in [("entries", trie.get_top_k_for_prefix),
+                        ("tuples", trie.get_top_k_tuples_for_prefix),
+                        ("columns", trie.get_top_k_columns_for_prefix)]:
+        seconds = min(timeit.repeat(lambda: [query(prefix, TOP_K) for prefix in prefixes], number=1, repeat=5))
+
+        print(f"{name:<8} {seconds:8.3f}s   {len(prefixes) / seconds:10.0f} queries/s")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
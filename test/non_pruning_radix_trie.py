@@ -1,15 +1,15 @@
-from typing import List
+from typing import List, Tuple
 
-from pypruningradixtrie.entry import Entry
 from pypruningradixtrie.trie import PruningRadixTrie
 from pypruningradixtrie.trie_node import TrieNode
 
 
 class NonPruningRadixTrie(PruningRadixTrie):
-    def _should_skip_node_and_all_children(self, node: TrieNode, results: List[Entry], top_k: int) -> bool:
+    def _should_skip_node_and_all_children(self, node: TrieNode, results: List[Tuple[str, float]],
+                                          top_k: int) -> bool:
         """
         :param node: root of possible new branch to look through
-        :param results: results that were already collected
+        :param results: (term, score) tuples that were already collected
         :param top_k: number of results that we want to collect
 
         :return: always False to make behaviour non-pruning
@@ -19,11 +19,11 @@ class NonPruningRadixTrie(PruningRadixTrie):
 
     @staticmethod
     def _should_skip_all_children_of_node(node: TrieNode,
-                                          results: List[Entry],
+                                          results: List[Tuple[str, float]],
                                           top_k: int) -> bool:
         """
         :param node: root of possible new branch to look through
-        :param results: results that were already collected
+        :param results: (term, score) tuples that were already collected
         :param top_k: number of results that we want to collect
 
         :return: always False to make behaviour non-pruning
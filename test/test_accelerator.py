@@ -0,0 +1,82 @@
+import random
+import unittest
+from unittest import mock
+
+from pypruningradixtrie import accelerator
+from pypruningradixtrie.accelerator import calc_shared_prefix_len, find_child_index
+from pypruningradixtrie.insert import insert_term
+from pypruningradixtrie.trie import PruningRadixTrie
+from pypruningradixtrie.trie_node import TrieNode
+from test.non_pruning_radix_trie import NonPruningRadixTrie
+
+
+def random_trie(seed: int) -> PruningRadixTrie:
+    rnd = random.Random(seed)
+    trie = PruningRadixTrie()
+
+    for _ in range(500):
+        term = "".join(rnd.choice("abcä€ ") for _ in range(rnd.randint(1, 8)))
+        # few distinct scores, so that there are many ties
+        insert_term(trie, term, rnd.choice([1, 2, 3, 5, 8, 13.5]))
+
+    return trie
+
+
+class TestAccelerator(unittest.TestCase):
+    def test_calc_shared_prefix_len(self):
+        assert calc_shared_prefix_len("flower", "flowchart") == 4
+        assert calc_shared_prefix_len("flower", "flower power") == 6
+        assert calc_shared_prefix_len("flower", "power") == 0
+        assert calc_shared_prefix_len("", "flower") == 0
+        assert calc_shared_prefix_len("blüte", "blümchen") == 3
+        assert calc_shared_prefix_len("€10", "€1") == 2
+
+    def test_find_child_index(self):
+        children = [("flow", TrieNode(1)), ("power", TrieNode(2)), ("ärger", TrieNode(3))]
+
+        assert find_child_index(children, "flowchart") == 0
+        assert find_child_index(children, "pow") == 1
+        assert find_child_index(children, "ä") == 2
+        assert find_child_index(children, "xyz") == -1
+        assert find_child_index(children, "") == -1
+        assert find_child_index([], "flower") == -1
+
+    @unittest.skipUnless(accelerator.ACCELERATED, "compiled accelerator module is not built")
+    def test_accelerated_query_returns_same_results_as_pure_python(self):
+        for seed in range(5):
+            trie = random_trie(seed)
+
+            for prefix in ["", "a", "ab", "ä€", "c c", "€", "x", "abcabcabc"]:
+                for top_k in [1, 2, 5, 10, 1000]:
+                    accelerated_results = trie.get_top_k_for_prefix(prefix, top_k)
+
+                    with mock.patch("pypruningradixtrie.trie.find_top_k", None):
+                        pure_results = trie.get_top_k_for_prefix(prefix, top_k)
+
+                    assert accelerated_results == pure_results
+                    assert [type(e) for e in accelerated_results] == [type(e) for e in pure_results]
+
+    @unittest.skipUnless(accelerator.ACCELERATED, "compiled accelerator module is not built")
+    def test_accelerated_query_on_deep_trie_raises_recursion_error_like_pure_python(self):
+        depth = 500_000
+        trie = PruningRadixTrie()
+
+        # increasing scores, so that no branch gets pruned
+        node = trie._root
+        for score in range(1, depth + 1):
+            child = TrieNode(score)
+            node.add_child("a", child)
+            node.max_score_children = depth
+            node = child
+
+        for prefix in ["", "aaa"]:
+            with self.assertRaises(RecursionError):
+                trie.get_top_k_for_prefix(prefix, 5)
+
+            with mock.patch("pypruningradixtrie.trie.find_top_k", None):
+                with self.assertRaises(RecursionError):
+                    trie.get_top_k_for_prefix(prefix, 5)
+
+    def test_overridden_pruning_uses_pure_python(self):
+        assert PruningRadixTrie()._uses_default_pruning() is True
+        assert NonPruningRadixTrie()._uses_default_pruning() is False
@@ -1,15 +1,23 @@
+import importlib.util
 import os
+import tempfile
 import unittest
 from typing import Any, Dict
 
+from pypruningradixtrie.input.columnar_csv_input_provider import ColumnarCSVInputProvider
 from pypruningradixtrie.input.csv_input_provider import CSVInputProvider
 from pypruningradixtrie.input.json_input_provider import JSONInputProvider
-from pypruningradixtrie.insert import insert_term
+from pypruningradixtrie.input.aggregation import aggregate_input
+from pypruningradixtrie.input.input import Input
+from pypruningradixtrie.insert import fill_trie_from_columnar_file, fill_trie_from_file, insert_term
+from pypruningradixtrie.score_precision import IntegerScorePrecision
 from pypruningradixtrie.trie import PruningRadixTrie
 from pypruningradixtrie.trie_node import TrieNode
 
 base_path = os.path.join(os.path.dirname(__file__), '_resources')
 
+numpy_available = importlib.util.find_spec("numpy") is not None
+
 
 class TestPruningRadixTrieInsert(unittest.TestCase):
     def test_insert_data_from_csv_file(self):
@@ -39,6 +47,75 @@ class TestPruningRadixTrieInsert(unittest.TestCase):
         assert node.is_word_end is True
         assert node.get_score() == 1563 * 2021 / 10.0
 
+    @unittest.skipUnless(numpy_available, "numpy is not installed")
+    def test_insert_data_from_csv_file_column_wise(self):
+        trie = PruningRadixTrie()
+        fill_trie_from_columnar_file(trie, f'{base_path}/test_data.csv', ColumnarCSVInputProvider(',', chunk_size=5))
+
+        row_wise_trie = PruningRadixTrie(f'{base_path}/test_data.csv', CSVInputProvider(',', lambda x: float(x[1]), 0))
+
+        assert trie.get_num_entries() == 12 - 4
+        assert trie.get_top_k_for_prefix("f", 200) == row_wise_trie.get_top_k_for_prefix("f", 200)
+
+    @unittest.skipUnless(numpy_available, "numpy is not installed")
+    def test_insert_data_from_complex_csv_file_column_wise(self):
+        trie = PruningRadixTrie(f'{base_path}/test_data_complex.csv',
+                                ColumnarCSVInputProvider(',', term_index=1, score_indices=(0, 2),
+                                                         score_fun=lambda a, b: a + b))
+
+        assert trie.get_num_entries() == 3
+        node, _ = trie._get_node_by_term("flower power")
+
+        assert node.get_score() == float(1337 + 8)
+
+    @unittest.skipUnless(numpy_available, "numpy is not installed")
+    def test_columnar_csv_input_aggregates_and_skips_invalid_lines(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'data.csv')
+            with open(path, 'w') as f:
+                f.write("Term,Score\nflower,2\nflow,not a number\nflower power,5\nflower,3.5\nflaw\nflower,1\n")
+
+            terms, scores = ColumnarCSVInputProvider(',', chunk_size=2).read_input_columns(path)
+
+        assert terms.tolist() == ['flower power', 'flower']
+        assert scores.tolist() == [5.0, 6.5]
+
+    def test_insert_aggregated_data_from_csv_file(self):
+        input_provider = CSVInputProvider(',', lambda x: float(x[1]), 0)
+
+        trie = PruningRadixTrie()
+        fill_trie_from_file(trie, f'{base_path}/test_data.csv', input_provider, aggregate=True)
+
+        spilling_trie = PruningRadixTrie()
+        fill_trie_from_file(spilling_trie, f'{base_path}/test_data.csv', input_provider,
+                            aggregate=True, max_terms_in_memory=2)
+
+        not_aggregated_trie = PruningRadixTrie(f'{base_path}/test_data.csv', input_provider)
+
+        assert trie.get_num_entries() == spilling_trie.get_num_entries() == 12 - 4
+        assert trie.get_top_k_for_prefix("f", 200) == not_aggregated_trie.get_top_k_for_prefix("f", 200)
+        assert spilling_trie.get_top_k_for_prefix("f", 200) == not_aggregated_trie.get_top_k_for_prefix("f", 200)
+
+    def test_aggregate_input_sums_up_scores_of_duplicates(self):
+        entries = [Input("flower", 2), Input("flaw", 1), Input("flower power", 5), Input("flower", 3), Input("flaw", 4)]
+
+        aggregated = list(aggregate_input(entries))
+
+        assert aggregated == [Input("flower power", 5), Input("flower", 5), Input("flaw", 5)]
+
+    def test_aggregate_input_spills_to_disk_when_exceeding_memory_bound(self):
+        entries = [Input(f"term {i % 50}", 1) for i in range(1000)]
+
+        aggregated = list(aggregate_input(entries, max_terms_in_memory=3))
+
+        assert len(aggregated) == 50
+        assert {entry.query for entry in aggregated} == {f"term {i}" for i in range(50)}
+        assert all(entry.score == 20 for entry in aggregated)
+
+    def test_aggregate_input_rejects_invalid_memory_bound(self):
+        with self.assertRaises(ValueError):
+            aggregate_input([], max_terms_in_memory=0)
+
     def test_insert_duplicate_entry_sums_up_score(self):
         trie = PruningRadixTrie()
 
@@ -108,3 +185,63 @@ class TestPruningRadixTrieInsert(unittest.TestCase):
         # sorted by max_score_children desc
         assert node.children[0][0] == 'er power'
         assert node.children[1][0] == 'chart'
+
+    def test_identical_split_prefixes_share_one_string(self):
+        trie = PruningRadixTrie()
+
+        for term in ["red tulip", "blue tulip", "red rose bush", "red rose hip", "blue rose bush", "blue rose hip"]:
+            insert_term(trie, term, 1)
+
+        red_node, _ = trie._get_node_by_term("red ")
+        blue_node, _ = trie._get_node_by_term("blue ")
+
+        red_labels = sorted(red_node.children, key=lambda x: x[0])
+        blue_labels = sorted(blue_node.children, key=lambda x: x[0])
+
+        assert red_labels[0][0] == 'rose ' and red_labels[0][0] is blue_labels[0][0]
+
+        # leaf labels are not interned
+        red_leaf_labels = sorted(red_labels[0][1].children, key=lambda x: x[0])
+        blue_leaf_labels = sorted(blue_labels[0][1].children, key=lambda x: x[0])
+
+        assert red_leaf_labels[0][0] == 'bush' and red_leaf_labels[0][0] is not blue_leaf_labels[0][0]
+
+    def test_insert_with_integer_precision(self):
+        trie = PruningRadixTrie(f'{base_path}/test_data_complex.csv',
+                                CSVInputProvider(',', lambda x: float(x[0]) + float(x[2]) + 0.4, 1),
+                                score_precision=IntegerScorePrecision())
+
+        node, _ = trie._get_node_by_term("flower power")
+
+        assert type(node.get_score()) is int
+        assert node.get_score() == 1337 + 8
+        assert type(trie._root.max_score_children) is int
+
+    def test_insert_ignores_scores_that_round_to_zero(self):
+        trie = PruningRadixTrie(score_precision=IntegerScorePrecision())
+
+        for _ in range(3):
+            insert_term(trie, "flower", 0.4)
+        insert_term(trie, "flower power", 0)
+
+        assert trie.get_num_entries() == 0
+        assert trie.get_top_k_for_prefix("flower", 10) == []
+
+        insert_term(trie, "flower", 0.5)
+        insert_term(trie, "flower", 0.4)
+
+        node, _ = trie._get_node_by_term("flower")
+
+        assert trie.get_num_entries() == 1
+        assert node.is_word_end is True
+        assert node.get_score() == 1
+
+    def test_integer_precision_rounds_halves_away_from_zero(self):
+        assert [IntegerScorePrecision().quantize(score) for score in [0.5, 1.5, 2.5, 2.4, -0.5, -2.6]] == \
+               [1, 2, 3, 2, -1, -3]
+
+    def test_trie_node_has_no_dict(self):
+        node = TrieNode(42)
+
+        assert not hasattr(node, '__dict__')
+        assert node.get_score() == 42
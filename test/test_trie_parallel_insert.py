@@ -0,0 +1,113 @@
+import os
+import random
+import unittest
+
+from pypruningradixtrie.input.csv_input_provider import CSVInputProvider
+from pypruningradixtrie.input.input import Input
+from pypruningradixtrie.insert import insert_term
+from pypruningradixtrie.parallel_insert import (_decode_trie, _encode_trie, fill_trie_from_file_parallel,
+                                                 fill_trie_parallel)
+from pypruningradixtrie.trie import PruningRadixTrie
+
+base_path = os.path.join(os.path.dirname(__file__), '_resources')
+
+TERMS = [("flower power", 140), ("flower", 20), ("flowchart", 40), ("apple", 70), ("apple pie", 90),
+         ("banana", 10), ("band", 35), ("flower", 5), ("zebra", 3), ("apricot", 200)]
+
+
+class TestPruningRadixTrieParallelInsert(unittest.TestCase):
+    def test_parallel_insert_from_csv_file(self):
+        trie = PruningRadixTrie()
+
+        fill_trie_from_file_parallel(trie, f'{base_path}/test_data.csv',
+                                     CSVInputProvider(',', lambda x: float(x[1]), 0), num_workers=2)
+
+        sequential_trie = PruningRadixTrie(f'{base_path}/test_data.csv', CSVInputProvider(',', lambda x: float(x[1]), 0))
+
+        assert trie.get_num_entries() == sequential_trie.get_num_entries()
+        assert trie.get_top_k_for_prefix("f", 200) == sequential_trie.get_top_k_for_prefix("f", 200)
+
+    def test_parallel_insert_matches_sequential_insert(self):
+        trie = PruningRadixTrie()
+        fill_trie_parallel(trie, [Input(term, score) for term, score in TERMS], num_workers=2)
+
+        sequential_trie = PruningRadixTrie()
+        for term, score in TERMS:
+            insert_term(sequential_trie, term, score)
+
+        assert trie.get_num_entries() == sequential_trie.get_num_entries() == 9
+        for prefix in ["", "a", "ap", "b", "flow", "flower", "z", "x"]:
+            for top_k in [1, 3, 20]:
+                assert trie.get_top_k_for_prefix(prefix, top_k) == sequential_trie.get_top_k_for_prefix(prefix, top_k)
+
+    def test_parallel_insert_sorts_root_children_and_sets_max_score(self):
+        trie = PruningRadixTrie()
+        fill_trie_parallel(trie, [Input(term, score) for term, score in TERMS], num_workers=1)
+
+        assert trie._root.max_score_children == 200
+        assert [key for key, _ in trie._root.children] == ['ap', 'flow', 'ban', 'zebra']
+
+    def test_parallel_insert_into_non_empty_trie(self):
+        trie = PruningRadixTrie()
+        insert_term(trie, "flowers", 7)
+        insert_term(trie, "apple", 1)
+
+        fill_trie_parallel(trie, [Input(term, score) for term, score in TERMS], num_workers=2)
+
+        node, _ = trie._get_node_by_term("apple")
+
+        assert trie.get_num_entries() == 10
+        assert node.get_score() == 71
+        assert trie.get_top_k_for_prefix("flower", 2)[1].term == 'flower'
+
+    def test_parallel_insert_rejects_invalid_worker_count(self):
+        with self.assertRaises(ValueError):
+            fill_trie_parallel(PruningRadixTrie(), [], num_workers=0)
+
+    def test_parallel_insert_handles_empty_terms_like_sequential_insert(self):
+        terms = [("", 3), ("flower", 20), ("", 5)]
+
+        trie = PruningRadixTrie()
+        insert_term(trie, "", 1)
+        fill_trie_parallel(trie, [Input(term, score) for term, score in terms], num_workers=2)
+
+        sequential_trie = PruningRadixTrie()
+        insert_term(sequential_trie, "", 1)
+        for term, score in terms:
+            insert_term(sequential_trie, term, score)
+
+        assert trie.get_num_entries() == sequential_trie.get_num_entries() == 4
+        assert trie.get_top_k_for_prefix("", 10) == sequential_trie.get_top_k_for_prefix("", 10)
+
+    def test_parallel_insert_returns_equal_scores_in_sequential_order(self):
+        for seed in range(50):
+            rnd = random.Random(seed)
+            # few characters & scores, so that there are many ties and branches that get split
+            terms = [("".join(rnd.choice("abcd ") for _ in range(rnd.randint(0, 5))), rnd.choice([1, 2, 3]))
+                     for _ in range(40)]
+
+            trie = PruningRadixTrie()
+            sequential_trie = PruningRadixTrie()
+            for existing_trie in [trie, sequential_trie]:
+                insert_term(existing_trie, "a", 1)
+                insert_term(existing_trie, "x", 1)
+
+            fill_trie_parallel(trie, [Input(term, score) for term, score in terms], num_workers=2)
+
+            for term, score in terms:
+                insert_term(sequential_trie, term, score)
+
+            assert [key for key, _ in trie._root.children] == [key for key, _ in sequential_trie._root.children]
+            for top_k in [1, 2, 3, 5]:
+                assert trie.get_top_k_for_prefix("", top_k) == sequential_trie.get_top_k_for_prefix("", top_k)
+
+    def test_encoded_trie_decodes_to_same_structure(self):
+        trie = PruningRadixTrie()
+        for term, score in TERMS:
+            insert_term(trie, term, score)
+
+        decoded_trie = PruningRadixTrie()
+        decoded_trie._root = _decode_trie(_encode_trie(trie._root))
+
+        assert _encode_trie(decoded_trie._root) == _encode_trie(trie._root)
+        assert decoded_trie.get_top_k_for_prefix("", 20) == trie.get_top_k_for_prefix("", 20)
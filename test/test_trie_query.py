@@ -4,6 +4,7 @@ import unittest
 from pypruningradixtrie.entry import Entry
 from pypruningradixtrie.input.csv_input_provider import CSVInputProvider
 from pypruningradixtrie.insert import insert_term
+from pypruningradixtrie.score_precision import IntegerScorePrecision
 from pypruningradixtrie.trie import PruningRadixTrie
 from pypruningradixtrie.trie_node import TrieNode
 
@@ -39,6 +40,24 @@ class TestPruningRadixTrieQuery(unittest.TestCase):
                            Entry(term='flowchart', score=17),
                            Entry(term='flaky', score=12)]
 
+    def test_query_returns_tuples(self):
+        trie: PruningRadixTrie = self.base_trie()
+
+        results = trie.get_top_k_tuples_for_prefix("fla", 2)
+
+        assert results == [('flawless', 98), ('flaw', 79)]
+        assert all(type(result) is tuple for result in results)
+
+    def test_query_returns_columns(self):
+        trie: PruningRadixTrie = self.base_trie()
+
+        terms, scores = trie.get_top_k_columns_for_prefix("fla", 5)
+
+        assert terms == ['flawless', 'flaw', 'flaky']
+        assert scores == [98, 79, 12]
+
+        assert trie.get_top_k_columns_for_prefix("not in the trie", 5) == ([], [])
+
     def test_query_with_long_prefix(self):
         trie: PruningRadixTrie = self.base_trie()
 
@@ -67,9 +86,7 @@ class TestPruningRadixTrieQuery(unittest.TestCase):
     def test_should_skip_node_and_children_only_if_enough_results(self):
         trie = PruningRadixTrie()
 
-        results = [Entry(term='flower power', score=1337),
-                   Entry(term='flawless', score=98),
-                   Entry(term='funky', score=96)]
+        results = [('flower power', 1337), ('flawless', 98), ('funky', 96)]
 
         node = TrieNode(42)
         node.max_score_children = 23
@@ -85,9 +102,7 @@ class TestPruningRadixTrieQuery(unittest.TestCase):
     def test_should_not_skip_node_and_children_if_score_high(self):
         trie = PruningRadixTrie()
 
-        results = [Entry(term='flower power', score=1337),
-                   Entry(term='flawless', score=98),
-                   Entry(term='funky', score=96)]
+        results = [('flower power', 1337), ('flawless', 98), ('funky', 96)]
 
         # parent score high
         node = TrieNode(123)
@@ -136,3 +151,17 @@ class TestPruningRadixTrieQuery(unittest.TestCase):
                            Entry(term='flower power 3', score=40),
                            Entry(term='flower power 2', score=40),
                            Entry(term='flower power 1', score=40)]
+
+    def test_terms_with_same_quantized_score_are_returned_in_inserted_order(self):
+        trie = PruningRadixTrie(score_precision=IntegerScorePrecision())
+
+        insert_term(trie, "flower power 1", 40.2)
+        insert_term(trie, "flower power 2", 39.9)
+        insert_term(trie, "flower power 3", 41.4)
+        insert_term(trie, "flower power 4", 12)
+
+        results = trie.get_top_k_for_prefix("flower power ", 3)
+
+        assert results == [Entry(term='flower power 3', score=41),
+                           Entry(term='flower power 1', score=40),
+                           Entry(term='flower power 2', score=40)]
@@ -0,0 +1,181 @@
+import os
+import random
+import tempfile
+import unittest
+from typing import Dict
+
+from pypruningradixtrie.entry import Entry
+from pypruningradixtrie.input.csv_input_provider import CSVInputProvider
+from pypruningradixtrie.insert import insert_term
+from pypruningradixtrie.trie import PruningRadixTrie
+from pypruningradixtrie.trie_node import TrieNode
+from pypruningradixtrie.update import (InputDiff, apply_diff, delete_term, diff_term_scores, read_manifest,
+                                       set_term_score, update_trie_from_file, write_manifest)
+
+
+def build_trie(term_scores: Dict[str, float]) -> PruningRadixTrie:
+    trie = PruningRadixTrie()
+
+    for term in sorted(term_scores, key=len, reverse=True):
+        insert_term(trie, term, term_scores[term])
+
+    return trie
+
+
+def assert_max_scores_are_exact(node: TrieNode) -> None:
+    expected = max((max(child.get_score(), child.max_score_children) for _, child in node.children), default=0)
+
+    assert node.max_score_children == expected
+    assert [child.max_score_children for _, child in node.children] == \
+           sorted((child.max_score_children for _, child in node.children), reverse=True)
+
+    for _, child in node.children:
+        assert child.is_word_end or len(child.children) > 1
+        assert_max_scores_are_exact(child)
+
+
+def write_csv(path: str, term_scores: Dict[str, float]) -> None:
+    with open(path, 'w') as f:
+        f.write("Term,Score\n")
+        for term, score in term_scores.items():
+            f.write(f"{term},{score}\n")
+
+
+class TestPruningRadixTrieUpdate(unittest.TestCase):
+    def test_diff_term_scores(self):
+        diff = diff_term_scores({"flower": 42, "flaw": 79, "funky": 96},
+                                {"flower": 42, "flaw": 80, "fancy": 84})
+
+        assert diff == InputDiff(inserted={"fancy": 84}, changed={"flaw": 80}, deleted=["funky"])
+
+    def test_delete_term_removes_leaf_and_merges_parent(self):
+        trie = build_trie({"flower": 42, "flowchart": 17})
+
+        assert delete_term(trie, "flowchart") is True
+
+        assert trie.get_num_entries() == 1
+        assert [key for key, _ in trie._root.children] == ["flower"]
+        assert trie._root.max_score_children == 42
+
+    def test_delete_term_merges_node_with_only_child(self):
+        trie = build_trie({"flower": 42, "flower power": 1337})
+
+        assert delete_term(trie, "flower") is True
+
+        assert trie.get_num_entries() == 1
+        assert [key for key, _ in trie._root.children] == ["flower power"]
+        assert trie.get_top_k_for_prefix("flow", 5) == [Entry("flower power", 1337)]
+
+    def test_delete_term_not_in_trie(self):
+        trie = build_trie({"flower": 42, "flower power": 1337})
+
+        assert delete_term(trie, "flow") is False
+        assert delete_term(trie, "flowers") is False
+        assert trie.get_num_entries() == 2
+
+    def test_set_term_score_lowers_max_scores_and_reorders_children(self):
+        trie = build_trie({"flower power": 1337, "flawless": 98, "funky": 96})
+
+        insert_term(trie, "funky town", 200)
+
+        node, _ = trie._get_node_by_term("f")
+
+        assert [key for key, _ in node.children] == ["l", "unky"]
+
+        set_term_score(trie, "flower power", 1)
+
+        assert node.max_score_children == 200
+        assert [key for key, _ in node.children] == ["unky", "l"]
+        assert node.children[1][1].max_score_children == 98
+        assert trie.get_top_k_for_prefix("fl", 2) == [Entry("flawless", 98), Entry("flower power", 1)]
+
+    def test_set_term_score_of_new_term_reorders_children(self):
+        trie = build_trie({"ab": 10, "ac": 5, "b": 7})
+
+        set_term_score(trie, "acd", 100)
+
+        node, _ = trie._get_node_by_term("a")
+
+        assert [key for key, _ in node.children] == ["c", "b"]
+        assert_max_scores_are_exact(trie._root)
+        assert trie.get_top_k_for_prefix("a", 1) == [Entry("acd", 100)]
+
+    def test_change_and_delete_empty_term(self):
+        trie = build_trie({"": 3, "flower": 5})
+
+        apply_diff(trie, diff_term_scores({"": 3, "flower": 5}, {"": 7, "flower": 5}))
+
+        assert trie.get_num_entries() == 2
+        assert trie.get_top_k_for_prefix("", 10) == [Entry("", 7), Entry("flower", 5)]
+
+        assert delete_term(trie, "") is True
+
+        assert trie.get_num_entries() == 1
+        assert trie.get_top_k_for_prefix("", 10) == [Entry("flower", 5)]
+        assert delete_term(trie, "") is False
+
+    def test_apply_diff_matches_fresh_build(self):
+        rnd = random.Random(7)
+        all_terms = list({"".join(rnd.choice("ab c") for _ in range(rnd.randint(1, 7))) for _ in range(400)})
+
+        previous_scores = {term: rnd.random() for term in all_terms[:300]}
+        new_scores = dict(previous_scores)
+        for term in rnd.sample(sorted(previous_scores), 60):
+            del new_scores[term]
+        for term in rnd.sample(sorted(new_scores), 60):
+            new_scores[term] = rnd.random()
+        for term in all_terms[300:]:
+            new_scores[term] = rnd.random()
+
+        trie = build_trie(previous_scores)
+        apply_diff(trie, diff_term_scores(previous_scores, new_scores))
+
+        fresh_trie = build_trie(new_scores)
+
+        assert trie.get_num_entries() == fresh_trie.get_num_entries() == len(new_scores)
+        assert_max_scores_are_exact(trie._root)
+        for prefix in ["", "a", "b", " ", "ab", "ba c", "cc"]:
+            for top_k in [1, 5, 1000]:
+                assert trie.get_top_k_for_prefix(prefix, top_k) == fresh_trie.get_top_k_for_prefix(prefix, top_k)
+
+    def test_update_trie_from_file_with_manifest(self):
+        input_provider = CSVInputProvider(',', lambda x: float(x[1]), 0)
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            previous_path = os.path.join(tmp_dir, 'previous.csv')
+            new_path = os.path.join(tmp_dir, 'new.csv')
+            newest_path = os.path.join(tmp_dir, 'newest.csv')
+            manifest_path = os.path.join(tmp_dir, 'manifest.json')
+
+            write_csv(previous_path, {"flower": 42, "flaw": 79, "funky": 96})
+            write_csv(new_path, {"flower": 42, "flaw": 80, "fancy": 84})
+            write_csv(newest_path, {"flower": 42, "flaw": 80, "fancy": 84, "flaky": 12})
+
+            trie = PruningRadixTrie(previous_path, input_provider)
+
+            diff = update_trie_from_file(trie, new_path, input_provider,
+                                         previous_path=previous_path, manifest_path=manifest_path)
+
+            assert diff == InputDiff(inserted={"fancy": 84}, changed={"flaw": 80}, deleted=["funky"])
+            assert trie.get_top_k_for_prefix("f", 10) == [Entry("fancy", 84), Entry("flaw", 80), Entry("flower", 42)]
+
+            # second update only uses the manifest
+            diff = update_trie_from_file(trie, newest_path, input_provider, manifest_path=manifest_path)
+
+            assert diff == InputDiff(inserted={"flaky": 12}, changed={}, deleted=[])
+            assert trie.get_num_entries() == 4
+
+    def test_failed_manifest_write_keeps_previous_manifest(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            manifest_path = os.path.join(tmp_dir, 'manifest.json')
+            write_manifest(manifest_path, {"flower": 42})
+
+            with self.assertRaises(TypeError):
+                write_manifest(manifest_path, {"flower": 42, "flaw": object()})
+
+            assert read_manifest(manifest_path) == {"flower": 42}
+            assert os.listdir(tmp_dir) == ['manifest.json']
+
+    def test_update_trie_from_file_needs_previous_scores(self):
+        with self.assertRaises(ValueError):
+            update_trie_from_file(PruningRadixTrie(), "new.csv", CSVInputProvider(',', lambda x: float(x[1]), 0))